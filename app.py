@@ -14,18 +14,21 @@ import json
 import pandas as pd
 import plotly.express as px
 import traceback
-from utils.resumeanalyzer import ResumeAnalyzer, extracttextfrompdf, extracttextfromdocx
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_parser import ResumeParser
+from utils.analysis_cache import AnalysisCache, get_analysis_cache
+from utils.exporter import RESUME_EXPORT_QUERY, export_query
+from utils.assets import get_image_data_uri, load_lottie
+from config.connection_pool import get_pool
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data, 
+    DATABASE_PATH, get_database_connection, save_resume_data, save_resume_with_analysis,
     init_database, verify_admin, log_admin_action
 )
 from config.job_roles import JOB_ROLES
-from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
+from config.courses import RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role
 from dashboard.dashboard import DashboardManager
-import requests
 from streamlit_lottie import st_lottie
 import plotly.graph_objects as go
-import base64
 import io
 from docx import Document
 from docx.shared import Inches, Pt
@@ -37,8 +40,41 @@ from ui_components import (
     render_suggestions_section
 )
 from datetime import datetime
-from jobs.job_search import render_job_search
+from jobs.job_search import render_job_search, render_job_listings
+from jobs.job_listings import get_job_store
 from PIL import Image
+from utils.skill_matcher import get_job_roles_matcher, get_role_index
+
+# Process-wide resources, created on the first run and shared by every
+# session and rerun
+@st.cache_resource(show_spinner=False)
+def get_connection_pool():
+    """Migrated database and its connection pool"""
+    init_database()
+    return get_pool(DATABASE_PATH)
+
+@st.cache_resource(show_spinner=False)
+def get_resume_analyzer():
+    return ResumeAnalyzer()
+
+@st.cache_resource(show_spinner=False)
+def get_resume_parser():
+    return ResumeParser()
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard_manager():
+    return DashboardManager()
+
+@st.cache_resource(show_spinner=False)
+def get_job_role_indexes():
+    """Compiled JOB_ROLES skill matcher and role x skill matrix"""
+    return get_job_roles_matcher(), get_role_index()
+
+@st.cache_resource(show_spinner=False)
+def load_stylesheet(path):
+    """Read a CSS file once and wrap it in a <style> tag"""
+    with open(path) as f:
+        return f'<style>{f.read()}</style>'
 
 class ResumeApp:
     def __init__(self):
@@ -83,10 +119,16 @@ class ResumeApp:
             "ℹ️ ABOUT": self.render_about
         }
         
+        # Initialize database
+        self.db_pool = get_connection_pool()
+        
         # Initialize dashboard manager
-        self.dashboard_manager = DashboardManager()
+        self.dashboard_manager = get_dashboard_manager()
         
-        self.analyzer = ResumeAnalyzer()
+        self.analyzer = get_resume_analyzer()
+        self.parser = get_resume_parser()
+        self.skill_matcher, self.role_index = get_job_role_indexes()
+        self.analysis_cache = get_analysis_cache()
         #self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
         
@@ -96,12 +138,8 @@ class ResumeApp:
         if 'selected_role' not in st.session_state:
             st.session_state.selected_role = None
         
-        # Initialize database
-        init_database()
-        
         # Load external CSS
-        with open('style/style.css') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        st.markdown(load_stylesheet('style/style.css'), unsafe_allow_html=True)
         
         # Load Google Fonts
         st.markdown("""
@@ -109,12 +147,9 @@ class ResumeApp:
             <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
         """, unsafe_allow_html=True)
 
-    def load_lottie_url(self, url: str):
-        """Load Lottie animation from URL"""
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
+    def load_lottie_url(self, url: str, name: str = None):
+        """Load Lottie animation from local assets or cache (fetched in the background)"""
+        return load_lottie(url, name)
 
     def apply_global_styles(self):
         st.markdown("""
@@ -439,49 +474,19 @@ class ResumeApp:
         """, unsafe_allow_html=True)
 
     def load_image(self, image_name):
-        """Load image from static directory"""
-        try:
-            image_path = f"c:/Users/shree/Downloads/smart-resume-ai/{image_name}"
-            with open(image_path, "rb") as f:
-                image_bytes = f.read()
-            encoded = base64.b64encode(image_bytes).decode()
-            return f"data:image/png;base64,{encoded}"
-        except Exception as e:
-            print(f"Error loading image {image_name}: {e}")
-            return None
+        """Load image from the assets directory as a data URI"""
+        encoded = get_image_data_uri(image_name)
+        if encoded is None:
+            print(f"Error loading image {image_name}: not found in assets")
+        return encoded
 
     def export_to_excel(self):
-        """Export resume data to Excel"""
-        conn = get_database_connection()
-        
-        # Get resume data with analysis
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-        
+        """Export resume data to an Excel temp file and return its path"""
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-            
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-            
-            return output.getvalue()
+            return export_query(get_database_connection(), RESUME_EXPORT_QUERY, 'excel')
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
@@ -496,7 +501,7 @@ class ResumeApp:
             </div>
         """
 
-                  def analyze_resume(self, resume_text):
+    def analyze_resume(self, resume_text):
         """Analyze resume and store results"""
         analytics = self.analyzer.analyze_resume(resume_text)
         st.session_state.analytics_data = analytics
@@ -510,10 +515,7 @@ class ResumeApp:
         if uploaded_file is not None:
             try:
                 # Extract text from resume
-                if uploaded_file.type == "application/pdf":
-                    resume_text = extracttextfrompdf(uploaded_file)
-                else:
-                    resume_text = extracttextfromdocx(uploaded_file)
+                resume_text = self.parser.extract_text(uploaded_file)
 
                 # Store resume data
                 st.session_state.resume_data = {
@@ -862,21 +864,9 @@ class ResumeApp:
         """Render the about page"""
         # Apply modern styles
         from ui_components import apply_modern_styles
-        import base64
-        import os
-        
-        # Function to load image as base64
-        def get_image_as_base64(file_path):
-            try:
-                with open(file_path, "rb") as image_file:
-                    encoded = base64.b64encode(image_file.read()).decode()
-                    return f"data:image/jpeg;base64,{encoded}"
-            except:
-                return None
         
-        # Get image path and convert to base64
-        image_path = os.path.join(os.path.dirname(__file__), "assets", "124852522.jpeg")
-        image_base64 = get_image_as_base64(image_path)
+        # Profile image as base64 (encoded once per process)
+        image_base64 = get_image_data_uri("124852522.jpeg")
         
         apply_modern_styles()
         
@@ -1081,6 +1071,25 @@ class ResumeApp:
             </div>
         """, unsafe_allow_html=True)
     
+    def get_resume_text(self, uploaded_file, file_hash, quiet=False):
+        """Extracted text of an upload; kept in memory only, never on disk"""
+        text = self.analysis_cache.get(file_hash)
+        if text is not None:
+            return text
+        try:
+            if uploaded_file.type == "application/pdf":
+                text = self.parser.extract_text_from_pdf(uploaded_file)
+            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                text = self.parser.extract_text_from_docx(uploaded_file)
+            else:
+                text = uploaded_file.getvalue().decode()
+        except Exception:
+            if quiet:
+                return None
+            raise
+        self.analysis_cache.set(file_hash, text, persist=False)
+        return text
+
     def render_analyzer(self):
         """Render the resume analyzer page"""
         apply_modern_styles()
@@ -1122,63 +1131,61 @@ class ResumeApp:
         )
         if uploaded_file:
             with st.spinner("Analyzing your document..."):
-                # Get file content
-                text = ""
-                try:
-                    if uploaded_file.type == "application/pdf":
-                        text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        text = self.analyzer.extract_text_from_docx(uploaded_file)
-                    else:
-                        text = uploaded_file.getvalue().decode()
-                except Exception as e:
-                    st.error(f"Error reading file: {str(e)}")
-                    return
+                # Reruns and repeat uploads of the same file reuse cached results
+                file_hash = AnalysisCache.file_key(uploaded_file.getvalue())
+                cache_key = AnalysisCache.analysis_key(file_hash, role_info)
+                analysis = self.analysis_cache.get(cache_key)
 
-                
-                # Analyze the document
-                analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
-                
-                # Save resume data to database
-                resume_data = {
-                    'personal_info': {
-                        'name': analysis.get('name', ''),
-                        'email': analysis.get('email', ''),
-                        'phone': analysis.get('phone', ''),
-                        'linkedin': analysis.get('linkedin', ''),
-                        'github': analysis.get('github', ''),
-                        'portfolio': analysis.get('portfolio', '')
-                    },
-                    'summary': analysis.get('summary', ''),
-                    'target_role': selected_role,
-                    'target_category': selected_category,
-                    'education': analysis.get('education', []),
-                    'experience': analysis.get('experience', []),
-                    'projects': analysis.get('projects', []),
-                    'skills': analysis.get('skills', []),
-                    'template': ''
-                }
-                
-                # Save to database
-                try:
-                    resume_id = save_resume_data(resume_data)
-                    
-                    # Save analysis data
-                    analysis_data = {
-                        'resume_id': resume_id,
-                        'ats_score': analysis['ats_score'],
-                        'keyword_match_score': analysis['keyword_match']['score'],
-                        'format_score': analysis['format_score'],
-                        'section_score': analysis['section_score'],
-                        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                        'recommendations': ','.join(analysis['suggestions'])
+                if analysis is None:
+                    # Get file content
+                    try:
+                        text = self.get_resume_text(uploaded_file, file_hash)
+                    except Exception as e:
+                        st.error(f"Error reading file: {str(e)}")
+                        return
+
+                    # Analyze the document
+                    analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                    if text.strip():
+                        self.analysis_cache.set(cache_key, analysis)
+
+                    # Save resume data to database
+                    resume_data = {
+                        'personal_info': {
+                            'name': analysis.get('name', ''),
+                            'email': analysis.get('email', ''),
+                            'phone': analysis.get('phone', ''),
+                            'linkedin': analysis.get('linkedin', ''),
+                            'github': analysis.get('github', ''),
+                            'portfolio': analysis.get('portfolio', '')
+                        },
+                        'summary': analysis.get('summary', ''),
+                        'target_role': selected_role,
+                        'target_category': selected_category,
+                        'education': analysis.get('education', []),
+                        'experience': analysis.get('experience', []),
+                        'projects': analysis.get('projects', []),
+                        'skills': analysis.get('skills') or analysis.get('keyword_match', {}).get('found_skills', []),
+                        'template': ''
                     }
-                    save_analysis_data(resume_id, analysis_data)
-                    st.success("Resume data saved successfully!")
-                except Exception as e:
-                    st.error(f"Error saving to database: {str(e)}")
-                    print(f"Database error: {e}")
-                
+
+                    # Save to database
+                    try:
+                        analysis_data = {
+                            'ats_score': analysis['ats_score'],
+                            'keyword_match_score': analysis['keyword_match']['score'],
+                            'format_score': analysis['format_score'],
+                            'section_score': analysis['section_score'],
+                            'semantic_score': analysis.get('semantic_score'),
+                            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+                            'recommendations': ','.join(analysis['suggestions'])
+                        }
+                        save_resume_with_analysis(resume_data, analysis_data)
+                        st.success("Resume data saved successfully!")
+                    except Exception as e:
+                        st.error(f"Error saving to database: {str(e)}")
+                        print(f"Database error: {e}")
+
                 # Show results based on document type
                 if analysis.get('document_type') != 'resume':
                     st.error(f"⚠️ This appears to be a {analysis['document_type']} document, not a resume!")
@@ -1265,6 +1272,8 @@ class ResumeApp:
                     
                     st.metric("Format Score", f"{int(analysis.get('format_score', 0))}%")
                     st.metric("Section Score", f"{int(analysis.get('section_score', 0))}%")
+                    if analysis.get('semantic_score') is not None:
+                        st.metric("Semantic Match", f"{int(analysis['semantic_score'])}%")
                     
                     st.markdown("</div>", unsafe_allow_html=True)
                     
@@ -1345,9 +1354,48 @@ class ResumeApp:
                         st.markdown("</ul></div>", unsafe_allow_html=True)
                     
                     st.markdown("</div>", unsafe_allow_html=True)
-                
 
-                
+                # Best matching roles across every job category
+                roles_key = f"{file_hash}:roles:{self.role_index.fingerprint}"
+                best_roles = self.analysis_cache.get(roles_key)
+                if best_roles is None:
+                    resume_text = self.get_resume_text(uploaded_file, file_hash, quiet=True)
+                    if resume_text:
+                        best_roles = self.analyzer.rank_roles(resume_text, top_k=3)
+                        self.analysis_cache.set(roles_key, best_roles)
+
+                if best_roles:
+                    st.markdown("""
+                    <div class="feature-card">
+                        <h2>🎯 Best Matching Roles</h2>
+                    """, unsafe_allow_html=True)
+                    cols = st.columns(len(best_roles))
+                    for col, match in zip(cols, best_roles):
+                        with col:
+                            st.markdown(f"""
+                            <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
+                                <h4>{match['role']}</h4>
+                                <p style='color: #888;'>{match['category']}</p>
+                                <p>ATS Score: <b>{match['ats_score']}</b> · Keyword Match: <b>{match['keyword_match']['score']}%</b></p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                    st.markdown("</div>", unsafe_allow_html=True)
+
+                # Postings from the offline listings store that fit this resume
+                job_store = get_job_store()
+                resume_text = (
+                    self.get_resume_text(uploaded_file, file_hash, quiet=True) if job_store.count() else None
+                )
+                if resume_text:
+                    postings = job_store.jobs_for_resume(self.skill_matcher.find(resume_text), k=5)
+                    if postings:
+                        st.markdown("""
+                        <div class="feature-card">
+                            <h2>💼 Jobs for this Resume</h2>
+                        """, unsafe_allow_html=True)
+                        render_job_listings(postings)
+                        st.markdown("</div>", unsafe_allow_html=True)
+
                 # Course Recommendations
                 st.markdown("""
                 <div class="feature-card">
@@ -1355,10 +1403,7 @@ class ResumeApp:
                 """, unsafe_allow_html=True)
                 
                 # Get courses based on role and category
-                courses = get_courses_for_role(selected_role)
-                if not courses:
-                    category = get_category_for_role(selected_role)
-                    courses = COURSES_BY_CATEGORY.get(category, {}).get(selected_role, [])
+                courses = get_courses_for_role(selected_role) or ()
                 
                 # Display courses in a grid
                 cols = st.columns(2)
@@ -1490,7 +1535,9 @@ class ResumeApp:
         
         # Admin login/logout in sidebar
         with st.sidebar:
-            st_lottie(self.load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json"), height=200, key="sidebar_animation")
+            sidebar_animation = self.load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json", name="sidebar")
+            if sidebar_animation:
+                st_lottie(sidebar_animation, height=200, key="sidebar_animation")
             st.title("Smart Resume AI")
             st.markdown("---")
             
@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that goes back to its pool on close()"""
+
+    def close(self):
+        # Callers still close() after every query; keep the connection
+        # (and its prepared statement cache) alive for the next one.
+        if self.in_transaction:
+            self.rollback()
+
+    def dispose(self):
+        """Really close the underlying database handle"""
+        super().close()
+
+
+class ConnectionPool:
+    """Per-thread pool of tuned, WAL-mode SQLite connections
+
+    Each thread gets its own connection. Streamlit runs every script
+    rerun on a fresh thread, so connections of finished threads are
+    reclaimed and handed to new threads instead of being reopened.
+    """
+
+    def __init__(self, db_path, busy_timeout_ms=5000, cache_size_kib=16384,
+                 cached_statements=256):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cache_size_kib = cache_size_kib
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._bound = {}
+        self._idle = []
+
+    def _connect(self):
+        # A connection only ever serves one live thread at a time,
+        # but may move to a new thread after its owner finished
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            factory=PooledConnection,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        # WAL lets readers and a writer work concurrently;
+        # NORMAL sync is durable across app crashes in WAL mode
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout_ms)}')
+        conn.execute(f'PRAGMA cache_size=-{int(self.cache_size_kib)}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+
+    def _reclaim_finished_threads(self):
+        for thread in [t for t in self._bound if not t.is_alive()]:
+            conn = self._bound.pop(thread)
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.append(conn)
+
+    def connection(self):
+        """Return this thread's connection, taking one from the pool on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        with self._lock:
+            self._reclaim_finished_threads()
+            conn = self._idle.pop() if self._idle else self._connect()
+            self._bound[threading.current_thread()] = conn
+        self._local.conn = conn
+        return conn
+
+    def close_all(self):
+        """Dispose of every connection opened by this pool"""
+        with self._lock:
+            connections = list(self._bound.values()) + self._idle
+            self._bound, self._idle = {}, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.dispose()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path='resume_data.db'):
+    """Return the process-wide pool for a database file"""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
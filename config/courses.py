@@ -1,3 +1,4 @@
+from types import MappingProxyType
 
 # Course recommendations organized by job categories
 COURSES_BY_CATEGORY = {
@@ -167,16 +168,28 @@ INTERVIEW_VIDEOS = {
     ]
 }
 
+# ==============================
+# LOOKUP INDEXES
+# ==============================
+# Built once at import; a role listed in two categories keeps the first
+
+def _build_course_indexes(catalog):
+    courses, categories = {}, {}
+    for category, roles in catalog.items():
+        for role, role_courses in roles.items():
+            if role not in categories:
+                categories[role] = category
+                courses[role] = role_courses
+    return MappingProxyType(courses), MappingProxyType(categories)
+
+
+COURSES_BY_ROLE, CATEGORY_BY_ROLE = _build_course_indexes(COURSES_BY_CATEGORY)
+
+
 def get_courses_for_role(role_name):
     """Helper function to get courses for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return roles[role_name]
-    return None
+    return COURSES_BY_ROLE.get(role_name)
 
 def get_category_for_role(role_name):
     """Helper function to get the category for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return category
-    return None
+    return CATEGORY_BY_ROLE.get(role_name)
@@ -1,89 +1,154 @@
+import ast
 import sqlite3
+import threading
 from datetime import datetime
+from config.connection_pool import get_pool
+from config.migrations import run_migrations
+
+DATABASE_PATH = 'resume_data.db'
 
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+    """Return this thread's pooled connection to the resume database.
+    
+    Calling close() on it hands it back to the pool rather than closing it.
+    """
+    return get_pool(DATABASE_PATH).connection()
+
+_data_version = 0
+_data_version_lock = threading.Lock()
+
+def get_data_version():
+    """Counter bumped after every committed resume/analysis write"""
+    return _data_version
+
+def bump_data_version():
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
+
+_database_initialized = False
+_init_lock = threading.Lock()
 
 def init_database():
-    """Initialize database tables"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
+    """Bring the database schema up to date (runs once per process)"""
+    global _database_initialized
+    if _database_initialized:
+        return
     
-    # Create resume_data table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_data (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        email TEXT NOT NULL,
-        phone TEXT NOT NULL,
-        linkedin TEXT,
-        github TEXT,
-        portfolio TEXT,
-        summary TEXT,
-        target_role TEXT,
-        target_category TEXT,
-        education TEXT,
-        experience TEXT,
-        projects TEXT,
-        skills TEXT,
-        template TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    # Create resume_skills table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_skills (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        skill_name TEXT NOT NULL,
-        skill_category TEXT NOT NULL,
-        proficiency_score REAL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-    )
-    ''')
+    with _init_lock:
+        if _database_initialized:
+            return
+        conn = get_database_connection()
+        try:
+            applied = run_migrations(conn)
+            if applied:
+                print(f"Applied database migrations: {applied}")
+        finally:
+            conn.close()
+        _database_initialized = True
+
+# Checked in order; the first category with a matching keyword wins
+SKILL_CATEGORY_RULES = [
+    ('Programming', ('python', 'java', 'javascript', 'c++', 'programming')),
+    ('Database', ('sql', 'database', 'mongodb')),
+    ('Cloud', ('aws', 'cloud', 'azure')),
+    ('Management', ('agile', 'scrum', 'management')),
+]
+
+SKILL_INSERT_SQL = '''
+INSERT INTO resume_skills (resume_id, skill_name, skill_category)
+VALUES (?, ?, ?)
+'''
+
+def categorize_skill(skill_name):
+    """Map a normalized skill name to its dashboard category"""
+    for category, keywords in SKILL_CATEGORY_RULES:
+        if any(keyword in skill_name for keyword in keywords):
+            return category
+    return 'Other'
+
+def normalize_skills(skills):
+    """Return unique, lower-cased skill names from a list, dict or their stored str() form"""
+    if isinstance(skills, str):
+        try:
+            skills = ast.literal_eval(skills)
+        except (ValueError, SyntaxError):
+            skills = skills.strip('[]').split(',')
+        if isinstance(skills, str):
+            skills = [skills]
+    if isinstance(skills, dict):
+        # Resume builder stores skills grouped by type
+        skills = [skill for group in skills.values() for skill in (group or [])]
     
-    # Create resume_analysis table
+    names = []
+    for skill in skills or []:
+        name = ' '.join(str(skill).strip(' \'"').split()).lower()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+def _skill_rows(resume_id, skills):
+    """Build resume_skills parameter tuples for one resume"""
+    return [(resume_id, name, categorize_skill(name)) for name in normalize_skills(skills)]
+
+def backfill_resume_skills(cursor):
+    """Populate resume_skills for resumes saved before it was maintained"""
     cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_analysis (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        ats_score REAL,
-        keyword_match_score REAL,
-        format_score REAL,
-        section_score REAL,
-        missing_skills TEXT,
-        recommendations TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-    )
+    SELECT id, skills FROM resume_data rd
+    WHERE skills IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM resume_skills rs WHERE rs.resume_id = rd.id)
     ''')
-    
-    # Create admin_logs table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin_logs (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        admin_email TEXT NOT NULL,
-        action TEXT NOT NULL,
-        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    rows = [row for resume_id, skills in cursor.fetchall() for row in _skill_rows(resume_id, skills)]
+    cursor.executemany(SKILL_INSERT_SQL, rows)
+
+RESUME_INSERT_SQL = '''
+INSERT INTO resume_data (
+    name, email, phone, linkedin, github, portfolio,
+    summary, target_role, target_category, education,
+    experience, projects, skills, template
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+ANALYSIS_INSERT_SQL = '''
+INSERT INTO resume_analysis (
+    resume_id, ats_score, keyword_match_score,
+    format_score, section_score, missing_skills,
+    recommendations, semantic_score
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _resume_row(data):
+    """Build the resume_data parameter tuple for one resume"""
+    personal_info = data.get('personal_info', {})
+    return (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        str(data.get('education', [])),
+        str(data.get('experience', [])),
+        str(data.get('projects', [])),
+        str(data.get('skills', [])),
+        data.get('template', '')
     )
-    ''')
-    
-    # Create admin table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        email TEXT NOT NULL UNIQUE,
-        password TEXT NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+
+def _analysis_row(resume_id, analysis):
+    """Build the resume_analysis parameter tuple for one analysis"""
+    return (
+        resume_id,
+        float(analysis.get('ats_score', 0)),
+        float(analysis.get('keyword_match_score', 0)),
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', ''),
+        analysis.get('semantic_score')
     )
-    ''')
-    
-    conn.commit()
-    conn.close()
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -91,33 +156,13 @@ def save_resume_data(data):
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
+        cursor.execute(RESUME_INSERT_SQL, _resume_row(data))
+        resume_id = cursor.lastrowid
+        cursor.executemany(SKILL_INSERT_SQL, _skill_rows(resume_id, data.get('skills', [])))
         
         conn.commit()
-        return cursor.lastrowid
+        bump_data_version()
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
@@ -131,29 +176,78 @@ def save_analysis_data(resume_id, analysis):
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
+        cursor.execute(ANALYSIS_INSERT_SQL, _analysis_row(resume_id, analysis))
         
         conn.commit()
+        bump_data_version()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
     finally:
         conn.close()
 
+def save_resume_with_analysis(data, analysis):
+    """Save a resume and its analysis atomically on one connection"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute(RESUME_INSERT_SQL, _resume_row(data))
+        resume_id = cursor.lastrowid
+        cursor.executemany(SKILL_INSERT_SQL, _skill_rows(resume_id, data.get('skills', [])))
+        cursor.execute(ANALYSIS_INSERT_SQL, _analysis_row(resume_id, analysis))
+        
+        conn.commit()
+        bump_data_version()
+        return resume_id
+    except Exception as e:
+        print(f"Error saving resume with analysis: {str(e)}")
+        conn.rollback()
+        return None
+    finally:
+        conn.close()
+
+def save_resumes_with_analysis(records):
+    """Bulk-save (resume_data, analysis) pairs in a single transaction.
+    
+    Returns the new resume ids in input order, or an empty list on failure.
+    """
+    records = list(records)
+    if not records:
+        return []
+    
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        # Take the write lock up front so the new ids are one contiguous block
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.executemany(RESUME_INSERT_SQL, [_resume_row(data) for data, _ in records])
+        
+        # AUTOINCREMENT hands out max+1 per row, so the batch ends at last_insert_rowid()
+        last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+        resume_ids = list(range(last_id - len(records) + 1, last_id + 1))
+        
+        cursor.executemany(ANALYSIS_INSERT_SQL, [
+            _analysis_row(resume_id, analysis)
+            for resume_id, (_, analysis) in zip(resume_ids, records)
+        ])
+        cursor.executemany(SKILL_INSERT_SQL, [
+            row
+            for resume_id, (data, _) in zip(resume_ids, records)
+            for row in _skill_rows(resume_id, data.get('skills', []))
+        ])
+        
+        conn.commit()
+        bump_data_version()
+        return resume_ids
+    except Exception as e:
+        print(f"Error bulk saving resume data: {str(e)}")
+        conn.rollback()
+        return []
+    finally:
+        conn.close()
+
 def get_resume_stats():
     """Get statistics about resumes"""
     conn = get_database_connection()
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 JOB_ROLES = {
     "Software Development and Engineering": {
         "Frontend Developer": {
@@ -164,4 +166,24 @@ JOB_ROLES = {
             }
         }
     }
-}
\ No newline at end of file
+}
+
+
+# Role name -> (category, role info); a name listed twice keeps the first
+def _build_role_index(catalog):
+    index = {}
+    for category, roles in catalog.items():
+        for role, info in roles.items():
+            index.setdefault(role, (category, info))
+    return MappingProxyType(index)
+
+
+ROLE_INDEX = _build_role_index(JOB_ROLES)
+
+
+def get_role(role_name, category=None):
+    """Return (category, role info) for a role name, or None if unknown"""
+    if category:
+        info = JOB_ROLES.get(category, {}).get(role_name)
+        return (category, info) if info is not None else None
+    return ROLE_INDEX.get(role_name)
@@ -0,0 +1,293 @@
+"""
+Versioned schema migrations for the resume database.
+
+Each migration runs once, in its own transaction, and is recorded in
+the schema_version table. Add new steps at the end with the next
+version number; never edit a migration that has already shipped.
+"""
+
+MIGRATIONS = []
+
+
+def migration(version, description):
+    """Register a migration step"""
+    def register(func):
+        MIGRATIONS.append((version, description, func))
+        return func
+    return register
+
+
+@migration(1, "baseline tables")
+def _baseline_tables(cursor):
+    # IF NOT EXISTS keeps this safe for databases created before migrations
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        phone TEXT NOT NULL,
+        linkedin TEXT,
+        github TEXT,
+        portfolio TEXT,
+        summary TEXT,
+        target_role TEXT,
+        target_category TEXT,
+        education TEXT,
+        experience TEXT,
+        projects TEXT,
+        skills TEXT,
+        template TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        resume_id INTEGER,
+        skill_name TEXT NOT NULL,
+        skill_category TEXT NOT NULL,
+        proficiency_score REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_analysis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        resume_id INTEGER,
+        ats_score REAL,
+        keyword_match_score REAL,
+        format_score REAL,
+        section_score REAL,
+        missing_skills TEXT,
+        recommendations TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS admin_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        admin_email TEXT NOT NULL,
+        action TEXT NOT NULL,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS admin (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL UNIQUE,
+        password TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+
+@migration(2, "resume_skills indexes and backfill")
+def _resume_skills(cursor):
+    from config.database import backfill_resume_skills
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_resume ON resume_skills(resume_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_name ON resume_skills(skill_name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_category ON resume_skills(skill_category)')
+    backfill_resume_skills(cursor)
+
+
+@migration(3, "analytics indexes")
+def _analytics_indexes(cursor):
+    # Join key for every dashboard query; the extra columns make the
+    # per-resume score lookups covering
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume
+    ON resume_analysis(resume_id, ats_score, keyword_match_score)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_analysis_created
+    ON resume_analysis(created_at, ats_score)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_analysis_ats
+    ON resume_analysis(ats_score)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_data_created
+    ON resume_data(created_at)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_data_category
+    ON resume_data(target_category, created_at)
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_resume_data_role
+    ON resume_data(target_role)
+    ''')
+    cursor.execute('ANALYZE')
+
+
+@migration(4, "daily_stats rollup")
+def _daily_stats(cursor):
+    # One row per (day, category). Analyses count towards the day and
+    # category of their resume, like the dashboard joins did.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        resume_count INTEGER NOT NULL DEFAULT 0,
+        analysis_count INTEGER NOT NULL DEFAULT 0,
+        ats_count INTEGER NOT NULL DEFAULT 0,
+        ats_sum REAL NOT NULL DEFAULT 0,
+        keyword_count INTEGER NOT NULL DEFAULT 0,
+        keyword_sum REAL NOT NULL DEFAULT 0,
+        high_score_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, category)
+    ) WITHOUT ROWID
+    ''')
+
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_resume_insert
+    AFTER INSERT ON resume_data
+    BEGIN
+        INSERT INTO daily_stats (day, category, resume_count)
+        VALUES (date(NEW.created_at), COALESCE(NEW.target_category, 'Other'), 1)
+        ON CONFLICT (day, category) DO UPDATE SET resume_count = resume_count + 1;
+    END
+    ''')
+
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_resume_delete
+    AFTER DELETE ON resume_data
+    BEGIN
+        UPDATE daily_stats SET resume_count = resume_count - 1
+        WHERE day = date(OLD.created_at) AND category = COALESCE(OLD.target_category, 'Other');
+    END
+    ''')
+
+    for name, event, row, sign in (('insert', 'INSERT', 'NEW', '+'), ('delete', 'DELETE', 'OLD', '-')):
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_daily_stats_analysis_{name}
+        AFTER {event} ON resume_analysis
+        BEGIN
+            INSERT INTO daily_stats (day, category)
+            SELECT date(COALESCE(r.created_at, {row}.created_at)), COALESCE(r.target_category, 'Other')
+            FROM (SELECT 1) LEFT JOIN resume_data r ON r.id = {row}.resume_id
+            WHERE 1
+            ON CONFLICT (day, category) DO NOTHING;
+
+            UPDATE daily_stats SET
+                analysis_count = analysis_count {sign} 1,
+                ats_count = ats_count {sign} ({row}.ats_score IS NOT NULL),
+                ats_sum = ats_sum {sign} COALESCE({row}.ats_score, 0),
+                keyword_count = keyword_count {sign} ({row}.keyword_match_score IS NOT NULL),
+                keyword_sum = keyword_sum {sign} COALESCE({row}.keyword_match_score, 0),
+                high_score_count = high_score_count {sign} COALESCE({row}.ats_score >= 70, 0)
+            WHERE (day, category) = (
+                SELECT date(COALESCE(r.created_at, {row}.created_at)), COALESCE(r.target_category, 'Other')
+                FROM (SELECT 1) LEFT JOIN resume_data r ON r.id = {row}.resume_id
+            );
+        END
+        ''')
+
+    # Backfill from existing history
+    cursor.execute('DELETE FROM daily_stats')
+    cursor.execute('''
+    INSERT INTO daily_stats (day, category, resume_count)
+    SELECT date(created_at), COALESCE(target_category, 'Other'), COUNT(*)
+    FROM resume_data
+    GROUP BY 1, 2
+    ''')
+    cursor.execute('''
+    INSERT INTO daily_stats (
+        day, category, analysis_count, ats_count, ats_sum,
+        keyword_count, keyword_sum, high_score_count
+    )
+    SELECT
+        date(COALESCE(r.created_at, a.created_at)), COALESCE(r.target_category, 'Other'),
+        COUNT(*), COUNT(a.ats_score), COALESCE(SUM(a.ats_score), 0),
+        COUNT(a.keyword_match_score), COALESCE(SUM(a.keyword_match_score), 0),
+        COALESCE(SUM(a.ats_score >= 70), 0)
+    FROM resume_analysis a
+    LEFT JOIN resume_data r ON r.id = a.resume_id
+    GROUP BY 1, 2
+    ON CONFLICT (day, category) DO UPDATE SET
+        analysis_count = excluded.analysis_count,
+        ats_count = excluded.ats_count,
+        ats_sum = excluded.ats_sum,
+        keyword_count = excluded.keyword_count,
+        keyword_sum = excluded.keyword_sum,
+        high_score_count = excluded.high_score_count
+    ''')
+
+
+@migration(5, "resume_analysis.semantic_score")
+def _semantic_score(cursor):
+    cursor.execute('PRAGMA table_info(resume_analysis)')
+    if 'semantic_score' not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute('ALTER TABLE resume_analysis ADD COLUMN semantic_score REAL')
+
+
+@migration(6, "daily_stats follows resume_analysis score updates")
+def _daily_stats_analysis_update(cursor):
+    # Keep the rollup in step when scores are rewritten in place
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_analysis_update
+    AFTER UPDATE OF ats_score, keyword_match_score ON resume_analysis
+    BEGIN
+        UPDATE daily_stats SET
+            ats_count = ats_count - (OLD.ats_score IS NOT NULL) + (NEW.ats_score IS NOT NULL),
+            ats_sum = ats_sum - COALESCE(OLD.ats_score, 0) + COALESCE(NEW.ats_score, 0),
+            keyword_count = keyword_count - (OLD.keyword_match_score IS NOT NULL)
+                + (NEW.keyword_match_score IS NOT NULL),
+            keyword_sum = keyword_sum - COALESCE(OLD.keyword_match_score, 0)
+                + COALESCE(NEW.keyword_match_score, 0),
+            high_score_count = high_score_count - COALESCE(OLD.ats_score >= 70, 0)
+                + COALESCE(NEW.ats_score >= 70, 0)
+        WHERE (day, category) = (
+            SELECT date(COALESCE(r.created_at, NEW.created_at)), COALESCE(r.target_category, 'Other')
+            FROM (SELECT 1) LEFT JOIN resume_data r ON r.id = NEW.resume_id
+        );
+    END
+    ''')
+
+
+def current_version(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+    return cursor.fetchone()[0]
+
+
+def run_migrations(conn):
+    """Apply pending migrations in order and return the versions applied"""
+    cursor = conn.cursor()
+    version = current_version(cursor)
+    conn.commit()
+
+    applied = []
+    for step_version, description, step in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if step_version <= version:
+            continue
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            # Another process may have migrated while we waited for the lock
+            cursor.execute('SELECT 1 FROM schema_version WHERE version = ?', (step_version,))
+            if cursor.fetchone() is None:
+                step(cursor)
+                cursor.execute(
+                    'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                    (step_version, description)
+                )
+                applied.append(step_version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return applied
@@ -0,0 +1,92 @@
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from config.database import get_data_version
+
+_MISSING = object()
+
+
+class QueryCache:
+    """Process-wide TTL cache for dashboard query results
+
+    Entries remember the data version they were computed at, so any
+    committed write through config.database makes them stale at once.
+    Writes made by other processes are picked up when the TTL expires.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = get_data_version()
+
+    def get(self, key):
+        version = get_data_version()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, version):
+        with self._lock:
+            # Don't store a result computed before a concurrent write
+            if version != self._version:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = QueryCache()
+
+
+def _freeze(value):
+    """Turn call arguments into a hashable cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def cached_query(ttl=300, method=False):
+    """Cache a reader's result by its arguments for `ttl` seconds
+
+    With method=True the first argument (self) is left out of the key,
+    so every session shares the same entries.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key_args = args[1:] if method else args
+            key = (func.__module__, func.__qualname__, _freeze(key_args), _freeze(kwargs))
+            value = _cache.get(key)
+            if value is _MISSING:
+                version = get_data_version()
+                value = func(*args, **kwargs)
+                _cache.set(key, value, ttl, version)
+            # Callers may mutate what they get back
+            return copy.deepcopy(value)
+        return wrapper
+    return decorate
+
+
+def clear_query_cache():
+    _cache.clear()
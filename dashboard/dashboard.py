@@ -8,10 +8,43 @@ import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
+from config.query_cache import cached_query
+from dashboard.insights import get_insights
+from utils.exporter import EXPORT_FORMATS, RESUME_EXPORT_QUERY, export_query, open_export
+
+RESUME_COLUMNS = [
+    'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub',
+    'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
+    'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
+]
+
+# Seconds a cached dashboard query may be reused; any save through
+# config.database invalidates the cache sooner
+DASHBOARD_CACHE_TTL = 300
+
+# Sort option -> (SQL sort expression, direction)
+RESUME_SORTS = {
+    'Newest first': ('r.created_at', 'DESC'),
+    'Oldest first': ('r.created_at', 'ASC'),
+    'Highest ATS score': ('COALESCE(a.ats_score, -1)', 'DESC'),
+    'Lowest ATS score': ('COALESCE(a.ats_score, -1)', 'ASC'),
+}
+
+@cached_query(ttl=DASHBOARD_CACHE_TTL)
+def get_distinct_values(column):
+    """Distinct non-empty values of a resume_data filter column (cached)"""
+    if column not in ('target_role', 'target_category'):
+        raise ValueError(f"Unsupported filter column: {column}")
+    cursor = get_database_connection().cursor()
+    cursor.execute(f"""
+        SELECT DISTINCT {column} FROM resume_data
+        WHERE {column} IS NOT NULL AND {column} <> ''
+        ORDER BY {column}
+    """)
+    return [row[0] for row in cursor.fetchall()]
 
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -26,6 +59,11 @@ class DashboardManager:
             'subtext': '#B0B0B0'
         }
         
+    @property
+    def conn(self):
+        """Pooled per-thread database connection"""
+        return get_database_connection()
+
     def apply_dashboard_style(self):
         """Apply custom styling for dashboard"""
         st.markdown("""
@@ -109,6 +147,7 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_resume_metrics(self):
         """Get resume-related metrics from database"""
         cursor = self.conn.cursor()
@@ -119,78 +158,52 @@ class DashboardManager:
         start_of_week = now - timedelta(days=now.weekday())
         start_of_month = now.replace(day=1)
         
-        # Fetch metrics for different time periods
-        metrics = {}
-        for period, start_date in [
+        periods = [
             ('Today', start_of_day),
             ('This Week', start_of_week),
             ('This Month', start_of_month),
             ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
-            
-            row = cursor.fetchone()
-            if row:
-                metrics[period] = {
-                    'total': row[0] or 0,
-                    'ats_score': row[1] or 0,
-                    'keyword_score': row[2] or 0,
-                    'high_scoring': row[3] or 0
-                }
-            else:
-                metrics[period] = {
-                    'total': 0,
-                    'ats_score': 0,
-                    'keyword_score': 0,
-                    'high_scoring': 0
-                }
+        ]
+        
+        # One scan computes every period with conditional aggregates
+        columns = []
+        params = []
+        for i, (_, start_date) in enumerate(periods):
+            columns.append(f"""
+                COUNT(DISTINCT CASE WHEN rd.created_at >= :p{i} THEN rd.id END),
+                ROUND(AVG(CASE WHEN rd.created_at >= :p{i} THEN ra.ats_score END), 1),
+                ROUND(AVG(CASE WHEN rd.created_at >= :p{i} THEN ra.keyword_match_score END), 1),
+                COUNT(DISTINCT CASE WHEN rd.created_at >= :p{i} AND ra.ats_score >= 70 THEN rd.id END)""")
+            params.append(start_date.strftime('%Y-%m-%d %H:%M:%S'))
+        
+        cursor.execute(f"""
+            SELECT {','.join(columns)}
+            FROM resume_data rd
+            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+            WHERE rd.created_at >= :p{len(periods) - 1}
+        """, {f'p{i}': value for i, value in enumerate(params)})
+        
+        row = cursor.fetchone() or (0,) * (4 * len(periods))
+        metrics = {}
+        for i, (period, _) in enumerate(periods):
+            total, ats_score, keyword_score, high_scoring = row[4 * i:4 * i + 4]
+            metrics[period] = {
+                'total': total or 0,
+                'ats_score': ats_score or 0,
+                'keyword_score': keyword_score or 0,
+                'high_scoring': high_scoring or 0
+            }
         
         return metrics
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_skill_distribution(self):
         """Get skill distribution data"""
         cursor = self.conn.cursor()
         cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
+            SELECT skill_category, COUNT(*) as count
+            FROM resume_skills
+            GROUP BY skill_category
             ORDER BY count DESC
         """)
         
@@ -201,23 +214,25 @@ class DashboardManager:
             
         return categories, counts
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_weekly_trends(self):
         """Get weekly submission trends"""
         cursor = self.conn.cursor()
         now = datetime.now()
         dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
         
-        submissions = []
-        for date in dates:
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM resume_data 
-                WHERE DATE(created_at) = DATE(?)
-            """, (date,))
-            submissions.append(cursor.fetchone()[0])
+        cursor.execute("""
+            SELECT day, SUM(resume_count)
+            FROM daily_stats
+            WHERE day BETWEEN ? AND ?
+            GROUP BY day
+        """, (dates[0], dates[-1]))
+        counts = dict(cursor.fetchall())
+        submissions = [counts.get(date, 0) for date in dates]
             
         return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_job_category_stats(self):
         """Get statistics by job category"""
         cursor = self.conn.cursor()
@@ -260,31 +275,20 @@ class DashboardManager:
         
         if st.sidebar.button("📥 Export Data"):
             if export_format == "Excel":
-                excel_data = self.export_to_excel()
-                if excel_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download Excel",
-                        data=excel_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
+                export_path, label, fmt = self.export_to_excel(), "⬇️ Download Excel", "excel"
             elif export_format == "CSV":
-                csv_data = self.export_to_csv()
-                if csv_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download CSV",
-                        data=csv_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv"
-                    )
+                export_path, label, fmt = self.export_to_csv(), "⬇️ Download CSV", "csv"
             else:
-                json_data = self.export_to_json()
-                if json_data:
+                export_path, label, fmt = self.export_to_json(), "⬇️ Download JSON", "ndjson"
+            
+            if export_path:
+                suffix, mime = EXPORT_FORMATS[fmt]
+                with open_export(export_path) as export_file:
                     st.sidebar.download_button(
-                        "⬇️ Download JSON",
-                        data=json_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
-                        mime="application/json"
+                        label,
+                        data=export_file,
+                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}{suffix}",
+                        mime=mime
                     )
 
         # Database Stats
@@ -296,133 +300,206 @@ class DashboardManager:
             - Storage Used: {stats['storage_size']}
         """)
 
-    def get_resume_data(self):
-        """Get all resume data"""
+    def _resume_filters_sql(self, filters):
+        """Build the WHERE clauses and parameters for the submissions filters"""
+        clauses, params = [], {}
+        if filters.get('role'):
+            clauses.append('r.target_role = :role')
+            params['role'] = filters['role']
+        if filters.get('category'):
+            clauses.append('r.target_category = :category')
+            params['category'] = filters['category']
+        if filters.get('start_date'):
+            clauses.append('r.created_at >= :start_date')
+            params['start_date'] = filters['start_date'].strftime('%Y-%m-%d')
+        if filters.get('end_date'):
+            clauses.append("r.created_at < date(:end_date, '+1 day')")
+            params['end_date'] = filters['end_date'].strftime('%Y-%m-%d')
+        return clauses, params
+
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
+    def count_resumes(self, filters=None):
+        """Count submissions matching the filters"""
+        clauses, params = self._resume_filters_sql(filters or {})
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM resume_data r {where}", params)
+        return cursor.fetchone()[0]
+
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
+    def get_resume_page(self, filters=None, sort='Newest first', after=None, page_size=50):
+        """Get one keyset-paginated page of submissions.
+        
+        Returns (rows, next_cursor); pass next_cursor back as `after`
+        to fetch the following page. next_cursor is None on the last page.
+        """
+        sort_expr, direction = RESUME_SORTS[sort]
+        clauses, params = self._resume_filters_sql(filters or {})
+        if after is not None:
+            op = '<' if direction == 'DESC' else '>'
+            clauses.append(
+                f"({sort_expr}, r.id, COALESCE(a.id, 0)) {op} (:after_key, :after_id, :after_analysis)"
+            )
+            params['after_key'], params['after_id'], params['after_analysis'] = after
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        params['limit'] = page_size + 1
+        
         cursor = self.conn.cursor()
         try:
-            cursor.execute('''
+            cursor.execute(f"""
+                SELECT 
+                    r.id, r.name, r.email, r.phone, r.linkedin, r.github, r.portfolio,
+                    r.target_role, r.target_category, r.created_at,
+                    CASE WHEN a.ats_score IS NULL THEN 'N/A' ELSE printf('%.1f%%', a.ats_score) END,
+                    CASE WHEN a.keyword_match_score IS NULL THEN 'N/A' ELSE printf('%.1f%%', a.keyword_match_score) END,
+                    CASE WHEN a.format_score IS NULL THEN 'N/A' ELSE printf('%.1f%%', a.format_score) END,
+                    CASE WHEN a.section_score IS NULL THEN 'N/A' ELSE printf('%.1f%%', a.section_score) END,
+                    {sort_expr} AS sort_key,
+                    COALESCE(a.id, 0) AS analysis_id
+                FROM resume_data r
+                LEFT JOIN resume_analysis a ON r.id = a.resume_id
+                {where}
+                ORDER BY sort_key {direction}, r.id {direction}, analysis_id {direction}
+                LIMIT :limit
+            """, params)
+            rows = cursor.fetchall()
+        except Exception as e:
+            print(f"Error fetching resume page: {str(e)}")
+            return [], None
+        
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            # A resume with several analyses spans several rows, so the
+            # analysis id completes the cursor
+            next_cursor = (rows[-1][-2], rows[-1][0], rows[-1][-1])
+        return [row[:-2] for row in rows], next_cursor
+
+    def export_filtered_resume_data(self, filters=None):
+        """Export submissions matching the filters to an Excel temp file"""
+        clauses, params = self._resume_filters_sql(filters or {})
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        query = f"""
             SELECT 
-                r.id,
-                r.name,
-                r.email,
-                r.phone,
-                r.linkedin,
-                r.github,
-                r.portfolio,
-                r.target_role,
-                r.target_category,
-                r.created_at,
-                a.ats_score,
-                a.keyword_match_score,
-                a.format_score,
-                a.section_score
+                r.id AS "ID", r.name AS "Name", r.email AS "Email", r.phone AS "Phone",
+                r.linkedin AS "LinkedIn", r.github AS "GitHub", r.portfolio AS "Portfolio",
+                r.target_role AS "Target Role", r.target_category AS "Target Category",
+                r.created_at AS "Submission Date",
+                a.ats_score AS "ATS Score", a.keyword_match_score AS "Keyword Match",
+                a.format_score AS "Format Score", a.section_score AS "Section Score"
             FROM resume_data r
             LEFT JOIN resume_analysis a ON r.id = a.resume_id
-            ORDER BY r.created_at DESC
-            ''')
-            return cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching resume data: {str(e)}")
-            return []
+            {where}
+            ORDER BY r.created_at DESC, r.id DESC
+        """
+        return export_query(self.conn, query, 'excel', params)
 
     def render_resume_data_section(self):
         """Render resume data section with Excel download"""
         st.markdown("<h2 class='section-title'>Resume Submissions</h2>", unsafe_allow_html=True)
         
-        # Get resume data
-        resume_data = self.get_resume_data()
+        # Style the dataframe
+        st.markdown("""
+        <style>
+        .resume-data {
+            background-color: #2D2D2D;
+            border-radius: 10px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+        }
+        </style>
+        """, unsafe_allow_html=True)
         
-        if resume_data:
-            # Convert to DataFrame
-            columns = [
-                'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 
-                'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
-                'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
-            ]
-            df = pd.DataFrame(resume_data, columns=columns)
+        with st.container():
+            st.markdown('<div class="resume-data">', unsafe_allow_html=True)
             
-            # Format scores as percentages
-            score_columns = ['ATS Score', 'Keyword Match', 'Format Score', 'Section Score']
-            for col in score_columns:
-                df[col] = df[col].apply(lambda x: f"{x*100:.1f}%" if pd.notnull(x) else "N/A")
+            # Add filters
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                target_role = st.selectbox(
+                    "Filter by Target Role",
+                    options=["All"] + get_distinct_values('target_role'),
+                    key="role_filter"
+                )
+            with col2:
+                target_category = st.selectbox(
+                    "Filter by Category",
+                    options=["All"] + get_distinct_values('target_category'),
+                    key="category_filter"
+                )
+            with col3:
+                date_range = st.date_input("Submission Date", value=(), key="date_filter")
+            with col4:
+                sort = st.selectbox("Sort by", options=list(RESUME_SORTS), key="resume_sort")
             
-            # Style the dataframe
-            st.markdown("""
-            <style>
-            .resume-data {
-                background-color: #2D2D2D;
-                border-radius: 10px;
-                padding: 1rem;
-                margin-bottom: 1rem;
+            filters = {
+                'role': None if target_role == "All" else target_role,
+                'category': None if target_category == "All" else target_category,
+                'start_date': date_range[0] if len(date_range) > 0 else None,
+                'end_date': date_range[1] if len(date_range) > 1 else None,
             }
-            </style>
-            """, unsafe_allow_html=True)
             
-            with st.container():
-                st.markdown('<div class="resume-data">', unsafe_allow_html=True)
-                
-                # Add filters
-                col1, col2 = st.columns(2)
-                with col1:
-                    target_role = st.selectbox(
-                        "Filter by Target Role",
-                        options=["All"] + list(df['Target Role'].unique()),
-                        key="role_filter"
-                    )
-                with col2:
-                    target_category = st.selectbox(
-                        "Filter by Category",
-                        options=["All"] + list(df['Target Category'].unique()),
-                        key="category_filter"
-                    )
-                
-                # Apply filters
-                filtered_df = df.copy()
-                if target_role != "All":
-                    filtered_df = filtered_df[filtered_df['Target Role'] == target_role]
-                if target_category != "All":
-                    filtered_df = filtered_df[filtered_df['Target Category'] == target_category]
-                
-                # Display filtered data
-                st.dataframe(
-                    filtered_df,
-                    use_container_width=True,
-                    hide_index=True
-                )
-                
-                # Add download buttons
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Download filtered data
-                    excel_buffer = BytesIO()
-                    filtered_df.to_excel(excel_buffer, index=False, engine='openpyxl')
-                    excel_buffer.seek(0)
-                    
-                    st.download_button(
-                        label="📥 Download Filtered Data",
-                        data=excel_buffer,
-                        file_name=f"resume_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_filtered_data"
-                    )
-                
-                with col2:
-                    # Download all data
-                    excel_buffer_all = BytesIO()
-                    df.to_excel(excel_buffer_all, index=False, engine='openpyxl')
-                    excel_buffer_all.seek(0)
-                    
-                    st.download_button(
-                        label="📥 Download All Data",
-                        data=excel_buffer_all,
-                        file_name=f"resume_data_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_all_data"
-                    )
-                
+            # Restart paging whenever the filters or sort order change
+            state_key = (tuple(filters.items()), sort)
+            if st.session_state.get('resume_page_state') != state_key:
+                st.session_state.resume_page_state = state_key
+                st.session_state.resume_page_cursors = [None]
+            cursors = st.session_state.resume_page_cursors
+            
+            total = self.count_resumes(filters)
+            if total == 0:
+                st.info("No resume submissions available")
                 st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.info("No resume submissions available")
+                return
+            
+            page_size = 50
+            rows, next_cursor = self.get_resume_page(filters, sort, cursors[-1], page_size)
+            st.dataframe(
+                pd.DataFrame(rows, columns=RESUME_COLUMNS),
+                use_container_width=True,
+                hide_index=True
+            )
+            
+            # Page navigation
+            page = len(cursors)
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                if st.button("← Previous", disabled=page == 1, key="resume_prev_page"):
+                    cursors.pop()
+                    st.rerun()
+            with col2:
+                pages = (total + page_size - 1) // page_size
+                st.markdown(f"<p style='text-align: center;'>Page {page} of {pages} · {total:,} submissions</p>", unsafe_allow_html=True)
+            with col3:
+                if st.button("Next →", disabled=next_cursor is None, key="resume_next_page"):
+                    cursors.append(next_cursor)
+                    st.rerun()
+            
+            # Add download buttons
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("📥 Prepare Filtered Data", key="prepare_filtered_data"):
+                    with open_export(self.export_filtered_resume_data(filters)) as export_file:
+                        st.download_button(
+                            label="📥 Download Filtered Data",
+                            data=export_file,
+                            file_name=f"resume_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            key="download_filtered_data"
+                        )
+            
+            with col2:
+                if st.button("📥 Prepare All Data", key="prepare_all_data"):
+                    with open_export(self.export_filtered_resume_data()) as export_file:
+                        st.download_button(
+                            label="📥 Download All Data",
+                            data=export_file,
+                            file_name=f"resume_data_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            key="download_all_data"
+                        )
+            
+            st.markdown('</div>', unsafe_allow_html=True)
 
     def render_admin_section(self):
         """Render admin section with logs and Excel download"""
@@ -475,95 +552,30 @@ class DashboardManager:
             st.info("No admin activity logs available")
 
     def export_to_excel(self):
-        """Export data to Excel format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to an Excel temp file and return its path"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            
-            # Create Excel writer object
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Resume Data', index=False)
-                
-                # Get the workbook and the worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Resume Data']
-                
-                # Add formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'fg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                # Write headers with formatting
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, min(max_length, 50))
-            
-            # Return the Excel file
-            output.seek(0)
-            return output.getvalue()
-            
+            return export_query(self.conn, RESUME_EXPORT_QUERY, 'excel')
         except Exception as e:
             st.error(f"Error exporting to Excel: {str(e)}")
             return None
 
     def export_to_csv(self):
-        """Export data to CSV format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to a CSV temp file and return its path"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_csv(index=False).encode('utf-8')
+            return export_query(self.conn, RESUME_EXPORT_QUERY, 'csv')
         except Exception as e:
             st.error(f"Error exporting to CSV: {str(e)}")
             return None
 
     def export_to_json(self):
-        """Export data to JSON format"""
-        query = """
-            SELECT 
-                rd.*, ra.*
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to a newline-delimited JSON temp file and return its path"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_json(orient='records', date_format='iso')
+            return export_query(self.conn, RESUME_EXPORT_QUERY, 'ndjson')
         except Exception as e:
             st.error(f"Error exporting to JSON: {str(e)}")
             return None
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_database_stats(self):
         """Get database statistics"""
         cursor = self.conn.cursor()
@@ -844,143 +856,13 @@ class DashboardManager:
 
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
-        cursor = self.conn.cursor()
-        indicators = {}
-        
-        # Compare with last week's data
-        for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
-            try:
-                if metric == 'resumes':
-                    cursor.execute("""
-                        SELECT 
-                            (COUNT(*) - (
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_data
-                    """)
-                elif metric == 'ats':
-                    cursor.execute("""
-                        SELECT 
-                            (AVG(ats_score) - (
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_analysis
-                    """)
-                
-                change = cursor.fetchone()[0] or 0
-                indicators[metric] = {
-                    'value': abs(round(change, 1)),
-                    'icon': '↑' if change >= 0 else '↓',
-                    'class': 'trend-up' if change >= 0 else 'trend-down'
-                }
-            except Exception:
-                indicators[metric] = {
-                    'value': 0,
-                    'icon': '→',
-                    'class': 'trend-neutral'
-                }
-        
-        return indicators
+        return get_insights()['indicators']
 
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
-        cursor = self.conn.cursor()
-        insights = []
-        
-        # Most Successful Job Category
-        cursor.execute("""
-            SELECT target_category, AVG(ats_score) as avg_score,
-                   COUNT(*) as submission_count
-            FROM resume_data rd
-            JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY target_category
-            ORDER BY avg_score DESC
-            LIMIT 1
-        """)
-        top_category = cursor.fetchone()
-        if top_category:
-            insights.append({
-                'title': 'Top Performing Category',
-                'icon': '🏆',
-                'description': f"{top_category[0]} leads with {top_category[1]:.1f}% average ATS score across {top_category[2]} submissions",
-                'trend_class': 'trend-up',
-                'trend_icon': '↑',
-                'trend_value': f"{top_category[1]:.1f}%"
-            })
-        
-        # Recent Improvement
-        cursor.execute("""
-            SELECT 
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at >= date('now', '-7 days')) as recent_score,
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at < date('now', '-7 days')) as old_score
-        """)
-        scores = cursor.fetchone()
-        if scores and scores[0] and scores[1]:
-            change = scores[0] - scores[1]
-            insights.append({
-                'title': 'Weekly Trend',
-                'icon': '📈',
-                'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
-                'trend_class': 'trend-up' if change >= 0 else 'trend-down',
-                'trend_icon': '↑' if change >= 0 else '↓',
-                'trend_value': f"{abs(change):.1f}%"
-            })
-        
-        # Most Common Skills
-        cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
-            ORDER BY count DESC
-            LIMIT 3
-        """)
-        top_skills = cursor.fetchall()
-        if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
-            insights.append({
-                'title': 'Top Skills',
-                'icon': '💡',
-                'description': f"Most in-demand skills: {skills_text}",
-                'trend_class': 'trend-up',
-                'trend_icon': '🔝',
-                'trend_value': f"Top {len(top_skills)}"
-            })
-        
-        return insights
+        return get_insights()['insights']
 
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, method=True)
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
         cursor = self.conn.cursor()
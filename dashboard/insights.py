@@ -0,0 +1,113 @@
+from config.database import get_database_connection
+from config.query_cache import cached_query
+
+# How long computed insights are reused across reruns and sessions
+INSIGHTS_TTL = 60
+
+# Rows older than this count as "last week" for week-over-week deltas
+CUTOFF_SQL = "date('now', '-7 days')"
+
+
+def _trend(current, previous):
+    """Percent change indicator; neutral when there is nothing to compare"""
+    if current is None or not previous:
+        return {'value': 0, 'icon': '→', 'class': 'trend-neutral'}
+    change = (current - previous) * 100.0 / previous
+    return {
+        'value': abs(round(change, 1)),
+        'icon': '↑' if change >= 0 else '↓',
+        'class': 'trend-up' if change >= 0 else 'trend-down'
+    }
+
+
+def _ratio(numerator, denominator):
+    return numerator / denominator if denominator else None
+
+
+def compute_insights(conn):
+    """Compute trend indicators and dashboard insights
+
+    One pass over the daily_stats rollup (grouped by category and split
+    at the one-week cutoff) plus one indexed GROUP BY for top skills.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT
+            category,
+            SUM(resume_count), SUM(ats_sum), SUM(ats_count), SUM(high_score_count),
+            SUM(CASE WHEN day < {CUTOFF_SQL} THEN resume_count ELSE 0 END),
+            SUM(CASE WHEN day < {CUTOFF_SQL} THEN ats_sum ELSE 0 END),
+            SUM(CASE WHEN day < {CUTOFF_SQL} THEN ats_count ELSE 0 END),
+            SUM(CASE WHEN day < {CUTOFF_SQL} THEN high_score_count ELSE 0 END)
+        FROM daily_stats
+        GROUP BY category
+    """)
+    categories = cursor.fetchall()
+
+    totals = [sum(row[i] for row in categories) for i in range(1, 9)]
+    resumes, ats_sum, ats_count, high, old_resumes, old_ats_sum, old_ats_count, old_high = totals
+
+    indicators = {
+        'resumes': _trend(resumes, old_resumes),
+        'ats': _trend(_ratio(ats_sum, ats_count), _ratio(old_ats_sum, old_ats_count)),
+        'high_performing': _trend(high, old_high),
+        'success_rate': _trend(_ratio(high * 100.0, resumes), _ratio(old_high * 100.0, old_resumes)),
+    }
+
+    insights = []
+
+    # Most Successful Job Category
+    scored = [row for row in categories if row[3]]
+    if scored:
+        top = max(scored, key=lambda row: row[2] / row[3])
+        avg_score = top[2] / top[3]
+        insights.append({
+            'title': 'Top Performing Category',
+            'icon': '🏆',
+            'description': f"{top[0]} leads with {avg_score:.1f}% average ATS score across {top[3]} submissions",
+            'trend_class': 'trend-up',
+            'trend_icon': '↑',
+            'trend_value': f"{avg_score:.1f}%"
+        })
+
+    # Recent Improvement
+    recent_score = _ratio(ats_sum - old_ats_sum, ats_count - old_ats_count)
+    old_score = _ratio(old_ats_sum, old_ats_count)
+    if recent_score and old_score:
+        change = recent_score - old_score
+        insights.append({
+            'title': 'Weekly Trend',
+            'icon': '📈',
+            'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
+            'trend_class': 'trend-up' if change >= 0 else 'trend-down',
+            'trend_icon': '↑' if change >= 0 else '↓',
+            'trend_value': f"{abs(change):.1f}%"
+        })
+
+    # Most Common Skills
+    cursor.execute("""
+        SELECT skill_name, COUNT(*) as count
+        FROM resume_skills
+        GROUP BY skill_name
+        ORDER BY count DESC
+        LIMIT 3
+    """)
+    top_skills = cursor.fetchall()
+    if top_skills:
+        skills_text = ", ".join(f"{skill} ({count} resumes)" for skill, count in top_skills)
+        insights.append({
+            'title': 'Top Skills',
+            'icon': '💡',
+            'description': f"Most in-demand skills: {skills_text}",
+            'trend_class': 'trend-up',
+            'trend_icon': '🔝',
+            'trend_value': f"Top {len(top_skills)}"
+        })
+
+    return {'indicators': indicators, 'insights': insights}
+
+
+@cached_query(ttl=INSIGHTS_TTL)
+def get_insights():
+    """Insights shared by every session, recomputed after writes or once per TTL"""
+    return compute_insights(get_database_connection())
@@ -5,9 +5,13 @@ from config.database import get_database_connection
 
 class FeedbackManager:
     def __init__(self):
-        self.conn = get_database_connection()
         self._ensure_table()
 
+    @property
+    def conn(self):
+        """Pooled per-thread database connection"""
+        return get_database_connection()
+
     def _ensure_table(self):
         cursor = self.conn.cursor()
         cursor.execute(
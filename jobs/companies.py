@@ -1,4 +1,5 @@
 """Company data and market insights for job search"""
+from types import MappingProxyType
 
 FEATURED_COMPANIES = {
     "tech": [
@@ -159,11 +160,39 @@ JOB_MARKET_INSIGHTS = {
     ]
 }
 
+# ==============================
+# LOOKUP INDEXES
+# ==============================
+# Built once at import; a company listed twice keeps its first entry
+
+def _build_company_indexes(catalog):
+    by_category = {category: tuple(companies) for category, companies in catalog.items()}
+    everyone = tuple(company for companies in by_category.values() for company in companies)
+
+    by_name, by_industry = {}, {}
+    for company in everyone:
+        by_name.setdefault(company["name"], company)
+        if "industry" in company:
+            by_industry.setdefault(company["industry"], []).append(company)
+
+    return (
+        MappingProxyType(by_category),
+        everyone,
+        MappingProxyType(by_name),
+        MappingProxyType({industry: tuple(companies) for industry, companies in by_industry.items()}),
+    )
+
+
+COMPANIES_BY_CATEGORY, ALL_COMPANIES, COMPANY_BY_NAME, COMPANIES_BY_INDUSTRY = (
+    _build_company_indexes(FEATURED_COMPANIES)
+)
+
+
 def get_featured_companies(category=None):
     """Get featured companies, optionally filtered by category"""
-    if category and category in FEATURED_COMPANIES:
-        return FEATURED_COMPANIES[category]
-    return [company for companies in FEATURED_COMPANIES.values() for company in companies]
+    if category and category in COMPANIES_BY_CATEGORY:
+        return list(COMPANIES_BY_CATEGORY[category])
+    return list(ALL_COMPANIES)
 
 def get_market_insights():
     """Get job market insights"""
@@ -171,17 +200,8 @@ def get_market_insights():
 
 def get_company_info(company_name):
     """Get company information by name"""
-    for companies in FEATURED_COMPANIES.values():
-        for company in companies:
-            if company["name"] == company_name:
-                return company
-    return None
+    return COMPANY_BY_NAME.get(company_name)
 
 def get_companies_by_industry(industry):
     """Get list of companies by industry"""
-    companies = []
-    for companies_list in FEATURED_COMPANIES.values():
-        for company in companies_list:
-            if "industry" in company and company["industry"] == industry:
-                companies.append(company)
-    return companies
\ No newline at end of file
+    return list(COMPANIES_BY_INDUSTRY.get(industry, ()))
@@ -0,0 +1,418 @@
+"""
+Offline job listings: a local store of postings with BM25 search.
+
+Postings are bulk-loaded from JSONL or CSV into SQLite. An in-memory
+inverted index (built once per process, rebuilt when the table changes)
+ranks them with BM25, filters them with the options from
+get_filter_options(), and matches them against a resume's skills.
+
+Usage:
+    python -m jobs.job_listings postings.jsonl [more.csv ...]
+"""
+import argparse
+import csv
+import hashlib
+import json
+import math
+import re
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from config.connection_pool import get_pool
+from utils.skill_matcher import normalize_skill
+
+LISTINGS_DB_PATH = "job_listings.db"
+
+FIELDS = [
+    "external_id", "title", "company", "location", "description", "skills",
+    "job_type", "experience_min", "experience_max", "salary_min", "salary_max",
+    "url", "posted_at"
+]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3  # Title terms count as this many body occurrences
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or "").casefold())
+
+
+# ==============================
+# LOADING
+# ==============================
+
+def _number(value):
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _skills(value) -> str:
+    if isinstance(value, str):
+        value = value.split(",")
+    return ",".join(s.strip() for s in (value or []) if s and s.strip())
+
+
+def _posting_key(raw: Dict) -> str:
+    """external_id, or a stable hash of the posting so re-imports replace it"""
+    external_id = str(raw.get("external_id") or raw.get("id") or "")
+    if external_id:
+        return external_id
+    identity = "\x1f".join(
+        " ".join(str(raw.get(field) or "").split()).casefold()
+        for field in ("title", "company", "location", "url")
+    )
+    return "sha1:" + hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def _normalize_posting(raw: Dict) -> tuple:
+    job_type = (raw.get("job_type") or "").strip().lower().replace(" ", "-").replace("_", "-")
+    return (
+        _posting_key(raw),
+        raw.get("title") or "",
+        raw.get("company") or "",
+        raw.get("location") or "",
+        raw.get("description") or "",
+        _skills(raw.get("skills")),
+        job_type,
+        _number(raw.get("experience_min")),
+        _number(raw.get("experience_max")),
+        _number(raw.get("salary_min")),
+        _number(raw.get("salary_max")),
+        raw.get("url") or "",
+        raw.get("posted_at") or "",
+    )
+
+
+def iter_postings(path: str) -> Iterable[Dict]:
+    """Yield raw postings from a .jsonl or .csv file"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# ==============================
+# INDEX
+# ==============================
+
+class JobIndex:
+    """BM25 inverted index plus filter and skill arrays over all postings"""
+
+    def __init__(self, rows):
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        n = len(rows)
+
+        def column(i):
+            return np.array([np.nan if row[i] is None else row[i] for row in rows], dtype=np.float64)
+
+        self.experience_min, self.experience_max = column(6), column(7)
+        self.salary_min, self.salary_max = column(8), column(9)
+        self.job_types = np.array([row[5] for row in rows], dtype=object)
+        self.remote = np.array(
+            [row[5] == "remote" or "remote" in (row[3] or "").casefold() for row in rows], dtype=bool
+        )
+        # Rows per distinct location; there are far fewer locations than postings
+        location_rows = {}
+        for i, row in enumerate(rows):
+            location_rows.setdefault(" ".join((row[3] or "").split()).casefold(), []).append(i)
+        self.location_rows = {
+            location: np.array(idx, dtype=np.int32) for location, idx in location_rows.items()
+        }
+
+        term_docs, skill_docs = {}, {}
+        lengths = np.zeros(n, dtype=np.float64)
+        self.skill_counts = np.zeros(n, dtype=np.float64)
+        for i, (_, title, company, location, description, job_type, *_, skills) in enumerate(rows):
+            counts = {}
+            for term in tokenize(title):
+                counts[term] = counts.get(term, 0) + TITLE_WEIGHT
+            for term in tokenize(" ".join((company, location, description, skills.replace(",", " ")))):
+                counts[term] = counts.get(term, 0) + 1
+            lengths[i] = sum(counts.values())
+            for term, tf in counts.items():
+                term_docs.setdefault(term, []).append((i, tf))
+
+            posting_skills = {normalize_skill(s) for s in skills.split(",") if s.strip()}
+            self.skill_counts[i] = len(posting_skills)
+            for skill in posting_skills:
+                skill_docs.setdefault(skill, []).append(i)
+
+        # Per-term BM25 weights are fixed once document lengths are known
+        avgdl = lengths.mean() if n else 0.0
+        self.postings = {}
+        for term, docs in term_docs.items():
+            idx = np.fromiter((d for d, _ in docs), dtype=np.int32, count=len(docs))
+            tf = np.fromiter((t for _, t in docs), dtype=np.float64, count=len(docs))
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[idx] / avgdl)
+            self.postings[term] = (idx, (idf * tf * (BM25_K1 + 1) / (tf + norm)).astype(np.float32))
+        self.skill_postings = {
+            skill: np.array(docs, dtype=np.int32) for skill, docs in skill_docs.items()
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ------------------------------
+    # Filters
+    # ------------------------------
+
+    @staticmethod
+    def _option_id(option):
+        if isinstance(option, dict):
+            option = option.get("id")
+        return option or "all"
+
+    @staticmethod
+    def _range(option_id):
+        """'1-3' -> (1, 3); '10+' -> (10, inf)"""
+        if option_id.endswith("+"):
+            return float(option_id[:-1]), math.inf
+        low, high = option_id.split("-")
+        return float(low), float(high)
+
+    @staticmethod
+    def _overlaps(low, high, values_min, values_max):
+        # Postings without the field are kept rather than hidden
+        lo = np.where(np.isnan(values_min), values_max, values_min)
+        hi = np.where(np.isnan(values_max), values_min, values_max)
+        unknown = np.isnan(lo)
+        return unknown | ((lo <= high) & (hi >= low))
+
+    def filter_mask(self, filters: Optional[Dict]):
+        mask = np.ones(len(self), dtype=bool)
+        if not filters:
+            return mask
+
+        experience = self._option_id(filters.get("experience"))
+        if experience != "all":
+            mask &= self._overlaps(*self._range(experience), self.experience_min, self.experience_max)
+
+        salary = self._option_id(filters.get("salary"))
+        if salary != "all":
+            mask &= self._overlaps(*self._range(salary), self.salary_min, self.salary_max)
+
+        job_type = self._option_id(filters.get("job_type"))
+        if job_type == "remote":
+            mask &= self.remote
+        elif job_type != "all":
+            mask &= self.job_types == job_type
+
+        location = " ".join((filters.get("location") or "").split()).casefold()
+        if location:
+            mask &= self._location_mask(location)
+        return mask
+
+    def _location_mask(self, location):
+        # Postings without a location are kept rather than hidden
+        matches = np.zeros(len(self), dtype=bool)
+        for name, idx in self.location_rows.items():
+            if not name or location in name:
+                matches[idx] = True
+        if location == "remote":
+            matches |= self.remote
+        return matches
+
+    # ------------------------------
+    # Ranking
+    # ------------------------------
+
+    @staticmethod
+    def _top_k(scores, mask, k):
+        scores = np.where(mask, scores, 0)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [(int(candidates[i]), float(scores[candidates[i]])) for i in order]
+
+    def search(self, query: str, filters=None, k=20):
+        """(row, score) pairs of the top-k BM25 matches"""
+        scores = np.zeros(len(self), dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is not None:
+                idx, weights = posting
+                scores[idx] += weights
+        return self._top_k(scores, self.filter_mask(filters), k)
+
+    def match_skills(self, skills: Iterable[str], filters=None, k=20):
+        """(row, score, overlap) of postings sharing the most skills
+
+        Score is the overlap normalized by sqrt(posting skill count), so
+        focused postings outrank ones that list every technology.
+        """
+        overlap = np.zeros(len(self), dtype=np.float64)
+        for skill in {normalize_skill(s) for s in skills}:
+            idx = self.skill_postings.get(skill)
+            if idx is not None:
+                overlap[idx] += 1
+        scores = overlap / np.sqrt(np.maximum(self.skill_counts, 1))
+        return [(row, score, int(overlap[row])) for row, score in self._top_k(scores, self.filter_mask(filters), k)]
+
+
+# ==============================
+# STORE
+# ==============================
+
+class JobListingStore:
+    """SQLite-backed job postings with a lazily built search index"""
+
+    def __init__(self, db_path: str = LISTINGS_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_version = None
+        self._ensure_table()
+
+    @property
+    def conn(self):
+        return get_pool(self.db_path).connection()
+
+    def _ensure_table(self):
+        conn = self.conn
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_listings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            external_id TEXT UNIQUE,
+            title TEXT NOT NULL,
+            company TEXT,
+            location TEXT,
+            description TEXT,
+            skills TEXT,
+            job_type TEXT,
+            experience_min REAL,
+            experience_max REAL,
+            salary_min REAL,
+            salary_max REAL,
+            url TEXT,
+            posted_at TEXT
+        )
+        ''')
+        conn.commit()
+
+    def load(self, postings: Iterable[Dict], batch_size: int = 1000) -> int:
+        """Insert or replace postings (keyed by external_id) and return the count"""
+        conn = self.conn
+        sql = f'''
+        INSERT OR REPLACE INTO job_listings ({", ".join(FIELDS)})
+        VALUES ({", ".join("?" * len(FIELDS))})
+        '''
+        total, batch = 0, []
+        try:
+            for raw in postings:
+                batch.append(_normalize_posting(raw))
+                if len(batch) >= batch_size:
+                    conn.executemany(sql, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(sql, batch)
+                total += len(batch)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return total
+
+    def load_file(self, path: str) -> int:
+        return self.load(iter_postings(path))
+
+    def _version(self):
+        return self.conn.execute("SELECT COUNT(*), MAX(id) FROM job_listings").fetchone()
+
+    @property
+    def index(self) -> JobIndex:
+        """Search index, rebuilt only when the table has changed"""
+        version = self._version()
+        if self._index is None or version != self._index_version:
+            with self._lock:
+                if self._index is None or version != self._index_version:
+                    rows = self.conn.execute('''
+                    SELECT id, title, company, location, description, job_type,
+                           experience_min, experience_max, salary_min, salary_max, skills
+                    FROM job_listings ORDER BY id
+                    ''').fetchall()
+                    self._index = JobIndex(rows)
+                    self._index_version = version
+        return self._index
+
+    def count(self) -> int:
+        return self._version()[0]
+
+    def _fetch(self, index, ranked):
+        if not ranked:
+            return []
+        ids = [int(index.ids[row]) for row, *_ in ranked]
+        cursor = self.conn.execute(
+            f"SELECT id, {', '.join(FIELDS)} FROM job_listings WHERE id IN ({', '.join('?' * len(ids))})",
+            ids,
+        )
+        by_id = {row[0]: dict(zip(["id"] + FIELDS, row)) for row in cursor.fetchall()}
+        return [by_id[i] for i in ids if i in by_id]
+
+    def search(self, query: str, filters: Optional[Dict] = None, k: int = 20) -> List[Dict]:
+        """Postings ranked by BM25 relevance to the query"""
+        index = self.index
+        ranked = index.search(query, filters, k)
+        results = self._fetch(index, ranked)
+        for posting, (_, score) in zip(results, ranked):
+            posting["score"] = round(score, 3)
+        return results
+
+    def jobs_for_resume(self, skills: Iterable[str], filters: Optional[Dict] = None, k: int = 20) -> List[Dict]:
+        """Postings ranked by overlap with a resume's extracted skills"""
+        skills = list(skills)
+        resume_skills = {normalize_skill(s) for s in skills}
+        index = self.index
+        ranked = index.match_skills(resume_skills, filters, k)
+        results = self._fetch(index, ranked)
+        for posting, (_, score, overlap) in zip(results, ranked):
+            posting_skills = [s for s in posting["skills"].split(",") if s]
+            posting["score"] = round(score, 3)
+            posting["matched_skills"] = [s for s in posting_skills if normalize_skill(s) in resume_skills]
+            posting["missing_skills"] = [s for s in posting_skills if normalize_skill(s) not in resume_skills]
+        return results
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_job_store(db_path: str = LISTINGS_DB_PATH) -> JobListingStore:
+    """Process-wide job listings store"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.db_path != db_path:
+            _store = JobListingStore(db_path)
+        return _store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load job postings into the local listings store.")
+    parser.add_argument("files", nargs="+", help="Postings as .jsonl or .csv")
+    parser.add_argument("--db", default=LISTINGS_DB_PATH, help="Listings database path")
+    args = parser.parse_args(argv)
+
+    store = JobListingStore(args.db)
+    for path in args.files:
+        print(f"{path}: {store.load_file(path)} postings", file=sys.stderr)
+    print(f"Total postings: {store.count()}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
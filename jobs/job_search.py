@@ -1,4 +1,7 @@
 import streamlit as st
+from functools import lru_cache
+from html import escape
+from urllib.parse import urlparse
 from typing import List, Dict
 from .job_portals import JobPortal
 from .suggestions import (
@@ -9,15 +12,28 @@ from .suggestions import (
     JOB_TYPES
 )
 from .companies import get_featured_companies, get_market_insights
+from .suggestion_index import SuggestionIndex
+from .job_listings import get_job_store
 
-def filter_suggestions(query: str, suggestions: List[Dict]) -> List[Dict]:
+# Typeahead indexes, built once at import
+JOB_SUGGESTION_INDEX = SuggestionIndex(JOB_SUGGESTIONS)
+LOCATION_SUGGESTION_INDEX = SuggestionIndex(LOCATION_SUGGESTIONS)
+
+@lru_cache(maxsize=16)
+def _suggestion_index(texts):
+    """Index for any other catalog, keyed by its suggestion texts"""
+    return SuggestionIndex([{"text": text} for text in texts])
+
+def filter_suggestions(query: str, suggestions: List[Dict], limit: int = 5) -> List[Dict]:
     """Filter suggestions based on user input"""
     if not query:
         return []
-    return [
-        s for s in suggestions 
-        if query.lower() in s["text"].lower()
-    ][:5]
+    if suggestions is JOB_SUGGESTIONS:
+        return JOB_SUGGESTION_INDEX.search(query, limit)
+    if suggestions is LOCATION_SUGGESTIONS:
+        return LOCATION_SUGGESTION_INDEX.search(query, limit)
+    index = _suggestion_index(tuple(s["text"] for s in suggestions))
+    return [suggestions[i] for i in index.search_positions(query, limit)]
 
 def get_filter_options():
     """Get filter options for job search"""
@@ -270,6 +286,37 @@ def render_market_insights():
                 </div>
             """, unsafe_allow_html=True)
 
+def _safe_url(url: str) -> str:
+    """The URL if it is http(s), else empty; blocks javascript: and data: links"""
+    url = (url or "").strip()
+    return url if urlparse(url).scheme.lower() in ("http", "https") else ""
+
+def render_job_listings(postings: List[Dict]):
+    """Render postings from the offline listings store"""
+    # Postings come from imported files, so every field is escaped
+    for posting in postings:
+        details = " · ".join(
+            escape(part) for part in (posting["company"], posting["location"], posting["job_type"]) if part
+        )
+        matched = posting.get("matched_skills")
+        skills_html = (
+            f"<p style='color: #00bfa5;'>Matching skills: {escape(', '.join(matched))}</p>" if matched
+            else f"<p style='color: #888;'>{escape(posting['skills'].replace(',', ', '))}</p>" if posting["skills"] else ""
+        )
+        url = _safe_url(posting["url"])
+        link_html = (
+            f"<a href='{escape(url)}' target='_blank' rel='noopener noreferrer' style='color: #00bfa5;'>View Posting →</a>"
+            if url else ""
+        )
+        st.markdown(f"""
+        <div style='padding: 10px; margin: 5px 0; border-radius: 5px; background: rgba(255,255,255,0.05);'>
+            <h4>{escape(posting["title"])}</h4>
+            <p>{details}</p>
+            {skills_html}
+            {link_html}
+        </div>
+        """, unsafe_allow_html=True)
+
 def render_job_search():
     """Render job search page with enhanced features"""
     st.title("🔍 Smart Job Search")
@@ -291,7 +338,7 @@ def render_job_search():
                                     placeholder="e.g. Software Engineer, Data Scientist")
             
             if job_query and len(job_query) >= 2:
-                filtered_jobs = [s["text"] for s in JOB_SUGGESTIONS if job_query.lower() in s["text"].lower()]
+                filtered_jobs = [s["text"] for s in JOB_SUGGESTION_INDEX.search(job_query, 10)]
                 if filtered_jobs:
                     job_query = st.selectbox("Select Job Title", filtered_jobs)
         
@@ -301,7 +348,7 @@ def render_job_search():
                                    placeholder="e.g. Bangalore, Mumbai")
             
             if location and len(location) >= 2:
-                filtered_locations = [s["text"] for s in LOCATION_SUGGESTIONS if location.lower() in s["text"].lower()]
+                filtered_locations = [s["text"] for s in LOCATION_SUGGESTION_INDEX.search(location, 10)]
                 if filtered_locations:
                     location = st.selectbox("Select Location", filtered_locations)
 
@@ -351,6 +398,19 @@ def render_job_search():
                             """, unsafe_allow_html=True)
                 else:
                     st.warning("No results found. Try different search terms or filters.")
+                
+                # Postings from the offline listings store, if any were loaded
+                store = get_job_store()
+                if store.count():
+                    postings = store.search(job_query, {
+                        "experience": experience,
+                        "salary": salary_range,
+                        "job_type": job_type,
+                        "location": location
+                    }, k=10)
+                    if postings:
+                        st.markdown("### 📋 Matching Job Listings")
+                        render_job_listings(postings)
             else:
                 st.warning("Please enter a job title or skills to search.")
         
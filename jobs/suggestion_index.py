@@ -0,0 +1,107 @@
+"""Prefix and n-gram index for job title / location typeahead"""
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+
+def _fold(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _grams(text: str, n: int):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class SuggestionIndex:
+    """
+    Ranked typeahead over a fixed list of {"text": ...} suggestions.
+
+    Matches are ranked: whole-text prefix, then word prefix, then any
+    substring, then fuzzy (shared trigrams) matches. Ties keep catalog
+    order. Results are memoized per query.
+    """
+
+    def __init__(self, suggestions: List[Dict], cache_size: int = 4096):
+        self.suggestions = list(suggestions)
+        self.keys = [_fold(s["text"]) for s in self.suggestions]
+
+        # Sorted (word suffix, id) pairs: "software engineer" is listed
+        # under "software engineer" and "engineer"
+        prefixes = []
+        for i, key in enumerate(self.keys):
+            start = 0
+            for word in key.split(" "):
+                prefixes.append((key[start:], i, start == 0))
+                start += len(word) + 1
+        prefixes.sort()
+        self._prefix_keys = [p[0] for p in prefixes]
+        self._prefix_entries = [(p[1], p[2]) for p in prefixes]
+
+        # Bigram and trigram posting lists for substring / fuzzy lookups
+        self._grams = {}
+        for i, key in enumerate(self.keys):
+            for n in (2, 3):
+                for gram in _grams(key, n):
+                    self._grams.setdefault(gram, []).append(i)
+
+        self._cached_search = lru_cache(maxsize=cache_size)(self._search)
+
+    def _prefix_matches(self, query):
+        whole, word = [], []
+        pos = bisect_left(self._prefix_keys, query)
+        while pos < len(self._prefix_keys) and self._prefix_keys[pos].startswith(query):
+            i, is_whole = self._prefix_entries[pos]
+            (whole if is_whole else word).append(i)
+            pos += 1
+        return sorted(set(whole)), sorted(set(word))
+
+    def _substring_matches(self, query):
+        if len(query) < 2:
+            return []
+        n = 3 if len(query) >= 3 else 2
+        postings = [self._grams.get(gram, ()) for gram in _grams(query, n)]
+        if not all(postings):
+            return []
+        candidates = set(min(postings, key=len))
+        for posting in postings:
+            candidates.intersection_update(posting)
+        return sorted(i for i in candidates if query in self.keys[i])
+
+    def _fuzzy_matches(self, query):
+        query_grams = _grams(query, 3)
+        if not query_grams:
+            return []
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._grams.get(gram, ()))
+        # At least half of the query's trigrams must appear
+        needed = (len(query_grams) + 1) // 2
+        return [i for i, count in sorted(shared.items(), key=lambda kv: (-kv[1], kv[0]))
+                if count >= needed]
+
+    def _search(self, query: str, k: int):
+        ranked, seen = [], set()
+        whole, word = self._prefix_matches(query)
+        # Later tiers only run when the earlier ones leave room
+        tiers = (lambda: whole, lambda: word,
+                 lambda: self._substring_matches(query), lambda: self._fuzzy_matches(query))
+        for tier in tiers:
+            for i in tier():
+                if i not in seen:
+                    seen.add(i)
+                    ranked.append(i)
+                    if len(ranked) == k:
+                        return tuple(ranked)
+        return tuple(ranked)
+
+    def search_positions(self, query: str, k: int = 5) -> Tuple[int, ...]:
+        """Catalog positions of the top-k suggestions"""
+        query = _fold(query or "")
+        if not query:
+            return ()
+        return self._cached_search(query, k)
+
+    def search(self, query: str, k: int = 5) -> List[Dict]:
+        """Top-k suggestions for what the user has typed so far"""
+        return [self.suggestions[i] for i in self.search_positions(query, k)]
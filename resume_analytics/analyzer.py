@@ -1,15 +1,95 @@
+import threading
 import spacy
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from spacy.matcher import Matcher, PhraseMatcher
+
+# Trained components the analyzer never reads; it only needs tokens,
+# like_num and sentence boundaries
+UNUSED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+def get_nlp(model="en_core_web_sm"):
+    """Return the process-wide spaCy pipeline, loading it on first use"""
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                try:
+                    nlp = spacy.load(model, exclude=UNUSED_COMPONENTS)
+                except OSError:
+                    # Only the tokenizer is needed, so a blank English
+                    # pipeline works when the model is not installed
+                    nlp = spacy.blank("en")
+                nlp.add_pipe("sentencizer")
+                _nlp = nlp
+    return _nlp
+
+# Common technical skills keywords
+TECH_SKILLS = (
+    "python", "java", "javascript", "react", "node.js", "sql",
+    "html", "css", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics"
+)
+
+def default_skill_vocabulary():
+    """Every required skill in config.job_roles plus TECH_SKILLS"""
+    from config.job_roles import JOB_ROLES
+    
+    skills = []
+    for roles in JOB_ROLES.values():
+        for role in roles.values():
+            skills.extend(role.get("required_skills", []))
+    return tuple(skills) + TECH_SKILLS
+
+@lru_cache(maxsize=16)
+def _build_matchers(skills):
+    """Compile the skill PhraseMatcher and experience Matcher once per vocabulary"""
+    nlp = get_nlp()
+    
+    # Case-insensitive phrases of any length; the first spelling of a
+    # skill is the one reported
+    display = {}
+    for skill in skills:
+        display.setdefault(" ".join(skill.split()).lower(), skill)
+    phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    for key, skill in display.items():
+        phrase_matcher.add(key, [nlp.make_doc(skill)])
+    
+    # Number followed by "year"/"years"/...
+    experience_matcher = Matcher(nlp.vocab)
+    experience_matcher.add("EXPERIENCE", [[{"LIKE_NUM": True}, {"LOWER": {"REGEX": "year"}}]])
+    
+    names = {nlp.vocab.strings[key]: skill for key, skill in display.items()}
+    return phrase_matcher, experience_matcher, names
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, skills=None):
+        self.skills = tuple(skills) if skills is not None else None
+    
+    @property
+    def nlp(self):
+        return get_nlp()
+    
+    @property
+    def matchers(self):
+        return _build_matchers(self.skills if self.skills is not None else default_skill_vocabulary())
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
-        
+        return self._analyze_doc(self.nlp(resume_text), resume_text)
+    
+    def analyze_resumes(self, resume_texts, batch_size=32, n_process=1):
+        """Analyze many resume texts with nlp.pipe, in input order"""
+        texts = list(resume_texts)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._analyze_doc(doc, text) for doc, text in zip(docs, texts)]
+    
+    def _analyze_doc(self, doc, resume_text):
+        """Compute metrics for one processed document"""
         # Basic metrics
         word_count = len(resume_text.split())
         sentence_count = len(list(doc.sents))
@@ -42,37 +122,19 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        phrase_matcher, _, names = self.matchers
+        return {names[match_id] for match_id, _, _ in phrase_matcher(doc)}
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
         # Simple heuristic - look for number + "years"
+        _, experience_matcher, _ = self.matchers
         experience_years = 0
-        for token in doc:
-            if token.like_num and token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                if "year" in next_token.text.lower():
-                    try:
-                        experience_years = max(experience_years, int(token.text))
-                    except ValueError:
-                        continue
+        for _, start, _ in experience_matcher(doc):
+            try:
+                experience_years = max(experience_years, int(doc[start].text))
+            except ValueError:
+                continue
         return experience_years
     
     def _calculate_profile_score(self, word_count, sentence_count, skills_count, experience_years):
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Part of every key; bump it whenever parsing or scoring changes so
+# results from an older parser or analyzer are never served
+CACHE_VERSION = 2
+
+
+class AnalysisCache:
+    """
+    Two-tier cache for extracted text and analysis results.
+    Entries are keyed by content hash, kept in an in-process
+    LRU and persisted to SQLite with size-based eviction.
+    Raw resume text is kept in memory only (persist=False).
+    """
+
+    def __init__(self, db_path="analysis_cache.db", max_entries=256,
+                 max_disk_bytes=64 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS analysis_cache (
+            cache_key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        ''')
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed "
+            "ON analysis_cache(accessed_at)"
+        )
+        # Drop extracted-text rows written before text stopped being
+        # persisted; only analysis and ranking keys have two colons
+        self._conn.execute(
+            "DELETE FROM analysis_cache WHERE cache_key NOT LIKE '%:%:%'"
+        )
+        self._conn.commit()
+
+    # ==============================
+    # KEYS
+    # ==============================
+
+    @staticmethod
+    def file_key(file_bytes):
+        """Versioned SHA-256 of the uploaded file bytes."""
+        return f"v{CACHE_VERSION}:{hashlib.sha256(file_bytes).hexdigest()}"
+
+    @staticmethod
+    def analysis_key(file_hash, job_req):
+        """Combine a file hash with the role's description and skills."""
+        from .similarity import role_document
+
+        # Keyword and semantic scores both depend on these fields
+        document = role_document(job_req or {})
+        digest = hashlib.sha256(f"v{CACHE_VERSION}\x1e{document}".encode("utf-8")).hexdigest()
+        return f"{file_hash}:{digest}"
+
+    # ==============================
+    # LOOKUP / STORE
+    # ==============================
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM analysis_cache WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE analysis_cache SET accessed_at = ? WHERE cache_key = ?",
+                    (time.time(), key)
+                )
+                self._conn.commit()
+                value = json.loads(row[0])
+            except Exception as e:
+                logging.error("Analysis cache read failed: %s", e)
+                return None
+
+            self._remember(key, value)
+            return value
+
+    def set(self, key, value, persist=True):
+        # Empty results (e.g. a scan read without OCR) are recomputed next time
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return
+        with self._lock:
+            self._remember(key, value)
+            if not persist:
+                return
+            payload = json.dumps(value)
+            try:
+                self._conn.execute('''
+                INSERT OR REPLACE INTO analysis_cache (cache_key, value, size, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ''', (key, payload, len(payload), time.time()))
+                self._evict_disk()
+                self._conn.commit()
+            except Exception as e:
+                logging.error("Analysis cache write failed: %s", e)
+                self._conn.rollback()
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM analysis_cache")
+            self._conn.commit()
+
+    # ==============================
+    # EVICTION
+    # ==============================
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM analysis_cache"
+        ).fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        # Drop least recently used rows until we are back under budget
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM analysis_cache ORDER BY accessed_at"
+        ).fetchall()
+        expired = []
+        for cache_key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            expired.append((cache_key,))
+            total -= size
+        self._conn.executemany(
+            "DELETE FROM analysis_cache WHERE cache_key = ?", expired
+        )
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Return the process-wide AnalysisCache instance."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = AnalysisCache()
+        return _default_cache
@@ -0,0 +1,116 @@
+"""
+Local asset loading with memory and disk caches.
+
+Images and Lottie animations are read from the bundled assets/ folder
+and kept in memory once loaded. Remote Lottie files are fetched in the
+background with a timeout and stored in a disk cache, so rendering
+never waits on the network and the app keeps working offline.
+"""
+import base64
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+LOTTIE_DIR = os.path.join(ASSETS_DIR, "lottie")
+CACHE_DIR = os.path.join(ASSETS_DIR, ".cache")
+
+FETCH_TIMEOUT = 5
+
+_lottie_cache = {}
+_pending = set()
+_lock = threading.Lock()
+_fetcher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="asset-fetch")
+
+
+# ==============================
+# IMAGES
+# ==============================
+
+@lru_cache(maxsize=32)
+def get_image_data_uri(filename):
+    """Return a bundled image as a base64 data URI, or None if missing"""
+    path = os.path.join(ASSETS_DIR, filename)
+    try:
+        with open(path, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode()
+    except OSError:
+        return None
+    mime = mimetypes.guess_type(path)[0] or "image/png"
+    return f"data:{mime};base64,{encoded}"
+
+
+# ==============================
+# LOTTIE
+# ==============================
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _fetch(url):
+    try:
+        response = requests.get(url, timeout=FETCH_TIMEOUT)
+        if response.status_code != 200:
+            return
+        data = response.json()
+        with _lock:
+            _lottie_cache[url] = data
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = _cache_path(url) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, _cache_path(url))
+    except Exception as e:
+        logging.info("Could not fetch %s: %s", url, e)
+    finally:
+        with _lock:
+            _pending.discard(url)
+
+
+def load_lottie(url=None, name=None):
+    """
+    Return Lottie animation data without blocking on the network.
+
+    Looks in memory, then assets/lottie/<name>.json, then the disk
+    cache. On a miss the URL is fetched in the background and None is
+    returned; a later rerun picks the animation up from the cache.
+    """
+    key = url or name
+    with _lock:
+        if key in _lottie_cache:
+            return _lottie_cache[key]
+
+    data = None
+    if name:
+        data = _read_json(os.path.join(LOTTIE_DIR, f"{name}.json"))
+    if data is None and url:
+        data = _read_json(_cache_path(url))
+
+    if data is not None:
+        with _lock:
+            _lottie_cache[key] = data
+        return data
+
+    if url:
+        with _lock:
+            if url not in _pending:
+                _pending.add(url)
+                _fetcher.submit(_fetch, url)
+    return None
@@ -0,0 +1,291 @@
+"""
+Batch resume analysis from the command line.
+
+Walks a folder of PDF/DOCX resumes, scores them in a process pool and
+streams results to JSONL or CSV as they finish.
+
+Usage:
+    python -m utils.batch_analyzer resumes/ --role "Data Scientist" -o results.jsonl
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config.database import save_resumes_with_analysis
+from config.job_roles import get_role
+from . import ocr
+from .resume_analyzer import ResumeAnalyzer
+from .resume_parser import ResumeParser
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+CSV_FIELDS = [
+    "path", "status", "seconds", "target_category", "target_role",
+    "name", "email", "phone", "ats_score", "keyword_match_score",
+    "format_score", "section_score", "semantic_score", "found_skills", "missing_skills", "error"
+]
+
+# Per-process analyzer objects, created once by _init_worker
+_parser = None
+_analyzer = None
+
+
+# ==============================
+# WORKER
+# ==============================
+
+def _init_worker():
+    global _parser, _analyzer
+    _parser = ResumeParser()
+    _analyzer = ResumeAnalyzer()
+
+
+def _init_pool_worker():
+    # The process pool is the parallelism here: one OCR page at a time
+    # per worker keeps tesseract processes bounded by --workers
+    ocr.OCR_MAX_WORKERS = 1
+    _init_worker()
+
+
+def _find_role(role_name, category=None):
+    found = get_role(role_name, category)
+    if found is None:
+        raise ValueError(f"Unknown job role: {role_name}")
+    return found
+
+
+def analyze_file(path, role_name=None, category=None, max_pages=None):
+    """Parse and score one resume file. Runs inside a worker process."""
+    if _parser is None:
+        _init_worker()
+
+    started = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            parsed = _parser.parse(f, max_pages=max_pages)
+
+        text = parsed["raw_text"]
+        if role_name:
+            target_category, job_req = _find_role(role_name, category)
+            target_role = role_name
+            analysis = _analyzer.analyze_resume({"raw_text": text}, job_req)
+        else:
+            # No role given: score against the best matching role
+            ranked = _analyzer.rank_roles(text, top_k=1)
+            if ranked:
+                analysis = ranked[0]
+                target_category, target_role = analysis.pop("category"), analysis.pop("role")
+            else:
+                analysis = _analyzer.analyze_resume({"raw_text": text}, {})
+                target_category, target_role = "", ""
+
+        return {
+            "path": path,
+            "status": "ok",
+            "seconds": round(time.perf_counter() - started, 3),
+            "target_category": target_category,
+            "target_role": target_role,
+            "parsed": {k: v for k, v in parsed.items() if k != "raw_text"},
+            "analysis": analysis,
+        }
+    except Exception as e:
+        return {
+            "path": path,
+            "status": "error",
+            "seconds": round(time.perf_counter() - started, 3),
+            "error": str(e),
+        }
+
+
+# ==============================
+# INPUT / OUTPUT
+# ==============================
+
+def iter_resume_files(root):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            if filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def _csv_row(result):
+    analysis = result.get("analysis", {})
+    keyword = analysis.get("keyword_match", {})
+    return {
+        "path": result["path"],
+        "status": result["status"],
+        "seconds": result["seconds"],
+        "target_category": result.get("target_category", ""),
+        "target_role": result.get("target_role", ""),
+        "name": analysis.get("name", ""),
+        "email": analysis.get("email", ""),
+        "phone": analysis.get("phone", ""),
+        "ats_score": analysis.get("ats_score", ""),
+        "keyword_match_score": keyword.get("score", ""),
+        "format_score": analysis.get("format_score", ""),
+        "section_score": analysis.get("section_score", ""),
+        "semantic_score": analysis.get("semantic_score", ""),
+        "found_skills": ",".join(keyword.get("found_skills", [])),
+        "missing_skills": ",".join(keyword.get("missing_skills", [])),
+        "error": result.get("error", ""),
+    }
+
+
+class ResultWriter:
+    """Streams results to a .jsonl or .csv file as they arrive."""
+
+    def __init__(self, path):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.is_csv = path.lower().endswith(".csv")
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS)
+            self.writer.writeheader()
+
+    def write(self, result):
+        if self.is_csv:
+            self.writer.writerow(_csv_row(result))
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# ==============================
+# DATABASE
+# ==============================
+
+def _to_records(result):
+    analysis = result["analysis"]
+    keyword = analysis.get("keyword_match", {})
+    resume_data = {
+        "personal_info": {
+            "full_name": analysis.get("name", ""),
+            "email": analysis.get("email", ""),
+            "phone": analysis.get("phone", ""),
+            "linkedin": analysis.get("linkedin", ""),
+            "github": analysis.get("github", ""),
+            "portfolio": analysis.get("portfolio", "")
+        },
+        "target_role": result["target_role"],
+        "target_category": result["target_category"],
+        "experience": result["parsed"].get("experience", ""),
+        "education": result["parsed"].get("education", ""),
+        "skills": result["parsed"].get("skills", []),
+        "template": ""
+    }
+    analysis_data = {
+        "ats_score": analysis.get("ats_score", 0),
+        "keyword_match_score": keyword.get("score", 0),
+        "format_score": analysis.get("format_score", 0),
+        "section_score": analysis.get("section_score", 0),
+        "semantic_score": analysis.get("semantic_score"),
+        "missing_skills": ",".join(keyword.get("missing_skills", [])),
+        "recommendations": ",".join(analysis.get("suggestions", []))
+    }
+    return resume_data, analysis_data
+
+
+def _flush_to_database(pending):
+    """Insert buffered resume/analysis pairs in a single transaction."""
+    if len(save_resumes_with_analysis(pending)) != len(pending):
+        raise RuntimeError(f"Failed to save {len(pending)} results to the database")
+
+
+# ==============================
+# MAIN
+# ==============================
+
+def run_batch(input_dir, output, role=None, category=None, workers=None,
+              max_pages=None, save_to_db=True, db_batch_size=200,
+              failures_path=None, log=sys.stderr):
+    files = list(iter_resume_files(input_dir))
+    total = len(files)
+    failures_path = failures_path or os.path.splitext(output)[0] + ".failures.jsonl"
+
+    writer = ResultWriter(output)
+    failures = []
+    pending = []
+    summary = {"total": total, "ok": 0, "failed": 0, "seconds": 0.0}
+    started = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_pool_worker) as pool:
+            futures = [
+                pool.submit(analyze_file, path, role, category, max_pages)
+                for path in files
+            ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                writer.write(result)
+
+                if result["status"] == "ok":
+                    summary["ok"] += 1
+                    if save_to_db and result["analysis"].get("document_type") == "resume":
+                        pending.append(_to_records(result))
+                        if len(pending) >= db_batch_size:
+                            _flush_to_database(pending)
+                            pending = []
+                else:
+                    summary["failed"] += 1
+                    failures.append(result)
+
+                print(f"[{done}/{total}] {result['status']:5} {result['seconds']:.2f}s {result['path']}", file=log)
+
+        if pending:
+            _flush_to_database(pending)
+    finally:
+        writer.close()
+
+    with open(failures_path, "w", encoding="utf-8") as f:
+        for failure in failures:
+            f.write(json.dumps(failure) + "\n")
+
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    summary["failures"] = failures_path
+    print(json.dumps(summary), file=log)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a folder of PDF/DOCX resumes.")
+    parser.add_argument("input_dir", help="Folder to scan recursively for resumes")
+    parser.add_argument("-o", "--output", default="batch_results.jsonl",
+                        help="Results file (.jsonl or .csv)")
+    parser.add_argument("--role", help="Target role from JOB_ROLES (default: best matching role)")
+    parser.add_argument("--category", help="Job category the role belongs to")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-pages", type=int, default=None,
+                        help="Only read the first N pages of each PDF")
+    parser.add_argument("--failures", default=None, help="Failure manifest path")
+    parser.add_argument("--db-batch-size", type=int, default=200)
+    parser.add_argument("--no-db", action="store_true",
+                        help="Do not store results in resume_data.db")
+    args = parser.parse_args(argv)
+
+    if args.role:
+        try:
+            _find_role(args.role, args.category)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if not args.no_db:
+        from config.database import init_database
+        init_database()
+
+    summary = run_batch(
+        args.input_dir, args.output, role=args.role, category=args.category,
+        workers=args.workers, max_pages=args.max_pages, save_to_db=not args.no_db,
+        db_batch_size=args.db_batch_size, failures_path=args.failures
+    )
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
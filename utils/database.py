@@ -4,12 +4,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from config.query_cache import cached_query
 from plotly.subplots import make_subplots
 
 
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
         self.colors = {
             "primary": "#4CAF50",
             "secondary": "#2196F3",
@@ -24,6 +24,11 @@ class DashboardManager:
             "subtext": "#B0B0B0",
         }
 
+    @property
+    def conn(self):
+        """Pooled per-thread database connection"""
+        return get_database_connection()
+
     def apply_dashboard_style(self):
         """Apply custom styling for dashboard"""
         st.markdown(
@@ -110,6 +115,7 @@ class DashboardManager:
             unsafe_allow_html=True,
         )
 
+    @cached_query(ttl=300, method=True)
     def get_resume_metrics(self):
         """Get resume-related metrics from database"""
         cursor = self.conn.cursor()
@@ -119,48 +125,53 @@ class DashboardManager:
         start_of_week = now - timedelta(days=now.weekday())
         start_of_month = now.replace(day=1)
 
-        metrics = {}
-        for period, start_date in [
+        periods = [
             ("Today", start_of_day),
             ("This Week", start_of_week),
             ("This Month", start_of_month),
             ("All Time", datetime(2000, 1, 1)),
-        ]:
-            try:
-                cursor.execute(
-                    """
-                    SELECT 
-                        COUNT(DISTINCT rd.id) as total_resumes,
-                        ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                        ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                        COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                    FROM resume_data rd
-                    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                    WHERE rd.created_at >= ?
-                    """,
-                    (start_date.strftime("%Y-%m-%d %H:%M:%S"),),
-                )
-                row = cursor.fetchone()
-            except Exception:
-                row = None
-
-            if row:
-                metrics[period] = {
-                    "total": row[0] or 0,
-                    "ats_score": row[1] or 0,
-                    "keyword_score": row[2] or 0,
-                    "high_scoring": row[3] or 0,
-                }
-            else:
-                metrics[period] = {
-                    "total": 0,
-                    "ats_score": 0,
-                    "keyword_score": 0,
-                    "high_scoring": 0,
-                }
+        ]
+
+        # One scan computes every period with conditional aggregates
+        columns = []
+        params = {}
+        for i, (_, start_date) in enumerate(periods):
+            columns.append(
+                f"""
+                COUNT(DISTINCT CASE WHEN rd.created_at >= :p{i} THEN rd.id END),
+                ROUND(AVG(CASE WHEN rd.created_at >= :p{i} THEN ra.ats_score END), 1),
+                ROUND(AVG(CASE WHEN rd.created_at >= :p{i} THEN ra.keyword_match_score END), 1),
+                COUNT(DISTINCT CASE WHEN rd.created_at >= :p{i} AND ra.ats_score >= 70 THEN rd.id END)"""
+            )
+            params[f"p{i}"] = start_date.strftime("%Y-%m-%d %H:%M:%S")
+
+        try:
+            cursor.execute(
+                f"""
+                SELECT {",".join(columns)}
+                FROM resume_data rd
+                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+                WHERE rd.created_at >= :p{len(periods) - 1}
+                """,
+                params,
+            )
+            row = cursor.fetchone()
+        except Exception:
+            row = None
+
+        metrics = {}
+        for i, (period, _) in enumerate(periods):
+            values = row[4 * i : 4 * i + 4] if row else (0, 0, 0, 0)
+            metrics[period] = {
+                "total": values[0] or 0,
+                "ats_score": values[1] or 0,
+                "keyword_score": values[2] or 0,
+                "high_scoring": values[3] or 0,
+            }
 
         return metrics
 
+    @cached_query(ttl=300, method=True)
     def get_keyword_stats(self):
         """Get keyword-level statistics (safe if table missing)"""
         query = """
@@ -189,6 +200,7 @@ class DashboardManager:
 
         return df
 
+    @cached_query(ttl=300, method=True)
     def get_job_role_stats(self):
         """Get job role statistics (safe if schema mismatch)"""
         query = """
@@ -225,6 +237,7 @@ class DashboardManager:
 
         return df
 
+    @cached_query(ttl=300, method=True)
     def get_recent_resumes(self, limit=10):
         """Get list of recent resumes"""
         query = """
@@ -263,26 +276,28 @@ class DashboardManager:
             )
         return df
 
+    @cached_query(ttl=300, method=True)
     def get_trend_data(self, days=30):
         """Get time-series data for trends (safe)"""
         start_date = datetime.now() - timedelta(days=days)
+        # Reads at most `days` x categories rows from the daily rollup
         query = """
         SELECT 
-            DATE(rd.created_at) as date,
-            COUNT(DISTINCT rd.id) as resumes_count,
-            ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-            ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score
-        FROM resume_data rd
-        LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        WHERE rd.created_at >= ?
-        GROUP BY DATE(rd.created_at)
-        ORDER BY date
+            day as date,
+            SUM(resume_count) as resumes_count,
+            ROUND(SUM(ats_sum) / SUM(ats_count), 1) as avg_ats_score,
+            ROUND(SUM(keyword_sum) / SUM(keyword_count), 1) as avg_keyword_score
+        FROM daily_stats
+        WHERE day >= ?
+        GROUP BY day
+        HAVING SUM(resume_count) > 0
+        ORDER BY day
         """
         try:
             df = pd.read_sql_query(
                 query,
                 self.conn,
-                params=(start_date.strftime("%Y-%m-%d %H:%M:%S"),),
+                params=(start_date.strftime("%Y-%m-%d"),),
             )
         except Exception:
             return pd.DataFrame(
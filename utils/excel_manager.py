@@ -1,44 +1,141 @@
+import csv
+import os
+import threading
 import pandas as pd
 import logging
 from datetime import datetime
 
 
+COLUMNS = ["user_id", "job_role", "content", "analysis_data", "created_at"]
+
+
 class ExcelManager:
     """
     Handles exporting resume data to Excel.
     Excel should be used for reporting/export,
     NOT as primary database storage.
+
+    New rows are appended to a sidecar CSV journal next to the workbook,
+    so a save only writes the new rows. The journal is folded into the
+    workbook by compact(), automatically once it holds `compact_every`
+    rows.
+
+    Compaction first renames the journal to a `.compacting` snapshot, so
+    rows appended meanwhile land in a fresh journal, and only deletes the
+    snapshot once it is in the workbook. A snapshot left behind by a crash
+    is folded on the next start.
     """
 
-    def __init__(self, file_name="resume_export.xlsx"):
+    def __init__(self, file_name="resume_export.xlsx", compact_every=1000):
         self.file_name = file_name
+        base = os.path.splitext(file_name)[0]
+        self.journal_name = base + ".journal.csv"
+        self.snapshot_name = base + ".journal.compacting.csv"
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._index = None
+        self._signature = None
+        self._journal_rows = None
 
-    def save_resume_data(self, user_id, job_role, content, analysis_data=None):
+        if os.path.exists(self.snapshot_name):
+            self.compact()
+
+    # ==============================
+    # STORAGE
+    # ==============================
+
+    def _file_signature(self):
+        """Size/mtime of the workbook and journals, to notice writes by other processes."""
+        signature = []
+        for path in (self.file_name, self.snapshot_name, self.journal_name):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _read_workbook(self):
+        try:
+            return pd.read_excel(self.file_name)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=COLUMNS)
+
+    @staticmethod
+    def _read_csv(path):
+        try:
+            return pd.read_csv(path, keep_default_na=False)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return pd.DataFrame(columns=COLUMNS)
+
+    def _read_journal(self):
+        """Rows not yet in the workbook: a pending snapshot, then the journal."""
+        return pd.concat(
+            [self._read_csv(self.snapshot_name), self._read_csv(self.journal_name)],
+            ignore_index=True
+        )
+
+    @staticmethod
+    def _make_row(user_id, job_role, content, analysis_data=None):
+        return {
+            "user_id": user_id,
+            "job_role": job_role,
+            "content": content,
+            "analysis_data": str(analysis_data) if analysis_data else None,
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    # ==============================
+    # INDEX
+    # ==============================
+
+    def _load_index(self):
+        """Build the user_id index from the workbook and journal, once."""
+        if self._index is not None and self._signature == self._file_signature():
+            return self._index
+
+        journal = self._read_journal()
+        df = pd.concat([self._read_workbook(), journal], ignore_index=True)
+        index = {}
+        for record in df.to_dict("records"):
+            index.setdefault(str(record["user_id"]), []).append(record)
+
+        self._index = index
+        self._journal_rows = len(journal)
+        self._signature = self._file_signature()
+        return index
+
+    # ==============================
+    # WRITES
+    # ==============================
+
+    def save_resumes_data(self, rows):
         """
-        Append resume data to Excel file.
-        Creates file if it does not exist.
+        Append several resumes in one write.
+        rows: iterable of (user_id, job_role, content, analysis_data) tuples.
         """
         try:
-            # Load existing file if present
-            try:
-                df = pd.read_excel(self.file_name)
-            except FileNotFoundError:
-                df = pd.DataFrame()
+            records = [self._make_row(*row) for row in rows]
+            if not records:
+                return True
 
-            # New row
-            new_row = {
-                "user_id": user_id,
-                "job_role": job_role,
-                "content": content,
-                "analysis_data": str(analysis_data) if analysis_data else None,
-                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
+            with self._lock:
+                index = self._load_index()
+                is_new = not os.path.exists(self.journal_name) or os.path.getsize(self.journal_name) == 0
+                with open(self.journal_name, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=COLUMNS)
+                    if is_new:
+                        writer.writeheader()
+                    writer.writerows(records)
 
-            # Append row
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+                for record in records:
+                    index.setdefault(str(record["user_id"]), []).append(record)
+                self._journal_rows += len(records)
+                self._signature = self._file_signature()
 
-            # Save file
-            df.to_excel(self.file_name, index=False)
+            if self._journal_rows >= self.compact_every:
+                # The rows are already safe in the journal
+                self.compact()
 
             return True
 
@@ -46,20 +143,81 @@ class ExcelManager:
             logging.error("Excel save failed: %s", e)
             return False
 
+    def save_resume_data(self, user_id, job_role, content, analysis_data=None):
+        """
+        Append resume data to Excel file.
+        Creates file if it does not exist.
+        """
+        return self.save_resumes_data([(user_id, job_role, content, analysis_data)])
+
+    @staticmethod
+    def _already_folded(workbook, snapshot):
+        """True if the workbook already ends with the snapshot's rows."""
+        if len(workbook) < len(snapshot):
+            return False
+        tail = workbook.tail(len(snapshot)).reindex(columns=COLUMNS)
+        head = snapshot.reindex(columns=COLUMNS)
+        return (
+            tail.fillna("").astype(str).values == head.fillna("").astype(str).values
+        ).all()
+
+    def _fold_snapshot(self):
+        snapshot = self._read_csv(self.snapshot_name)
+        workbook = self._read_workbook()
+        # A crash after the swap below leaves a snapshot that is already in
+        # the workbook; folding it again would duplicate its rows
+        if not snapshot.empty and not self._already_folded(workbook, snapshot):
+            df = pd.concat([workbook, snapshot], ignore_index=True)
+            # Write next to the target and swap, so a crash never leaves a
+            # half-written workbook
+            base, ext = os.path.splitext(self.file_name)
+            tmp_name = base + ".tmp" + ext
+            df.to_excel(tmp_name, index=False)
+            os.replace(tmp_name, self.file_name)
+        os.remove(self.snapshot_name)
+
+    def _compact(self):
+        if os.path.exists(self.snapshot_name):
+            # Left behind by an interrupted compaction
+            self._fold_snapshot()
+        if os.path.exists(self.journal_name):
+            # Writers start a fresh journal while this snapshot is folded
+            os.replace(self.journal_name, self.snapshot_name)
+            self._fold_snapshot()
+
+        self._journal_rows = len(self._read_csv(self.journal_name))
+        self._signature = self._file_signature()
+
+    def compact(self):
+        """
+        Fold journaled rows into the Excel file.
+        """
+        try:
+            with self._lock:
+                self._load_index()
+                self._compact()
+            return True
+        except Exception as e:
+            logging.error("Excel compaction failed: %s", e)
+            return False
+
+    # ==============================
+    # READS
+    # ==============================
+
     def get_all_resumes(self):
         """
         Return all resume records from Excel.
         """
-        try:
-            return pd.read_excel(self.file_name)
-        except FileNotFoundError:
-            return pd.DataFrame()
+        df = pd.concat([self._read_workbook(), self._read_journal()], ignore_index=True)
+        return df if len(df) else pd.DataFrame()
 
     def get_user_resumes(self, user_id):
         """
         Filter resumes by user_id.
         """
-        df = self.get_all_resumes()
-        if df.empty:
-            return df
-        return df[df["user_id"] == user_id]
\ No newline at end of file
+        with self._lock:
+            records = self._load_index().get(str(user_id), [])
+        if not records:
+            return pd.DataFrame()
+        return pd.DataFrame(records, columns=COLUMNS)
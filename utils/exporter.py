@@ -0,0 +1,151 @@
+"""
+Streaming data exports.
+
+Rows are read from SQLite in chunks and written straight to a temp file
+as CSV, NDJSON or XLSX, so memory use stays flat however large the
+table grows.
+"""
+import csv
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+EXPORT_FORMATS = {
+    "excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": (".csv", "text/csv"),
+    "ndjson": (".ndjson", "application/x-ndjson"),
+}
+
+# Full resume + analysis join shared by every "export all" button
+RESUME_EXPORT_QUERY = """
+    SELECT
+        rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    ORDER BY rd.id
+"""
+
+MAX_COLUMN_WIDTH = 50
+
+
+# ==============================
+# READING
+# ==============================
+
+def iter_chunks(conn, query, params=(), chunk_size=1000):
+    """Yield (columns, rows) chunks of a query result"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    columns = [d[0] for d in cursor.description]
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield columns, rows
+
+
+def _columns(conn, query, params):
+    # Column names are known even when the query returns no rows
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT * FROM ({query}) LIMIT 0", params)
+    return [d[0] for d in cursor.description]
+
+
+# ==============================
+# WRITERS
+# ==============================
+
+def _write_csv(path, columns, chunks):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for _, rows in chunks:
+            writer.writerows(rows)
+
+
+def _write_ndjson(path, columns, chunks):
+    with open(path, "w", encoding="utf-8") as f:
+        for _, rows in chunks:
+            for row in rows:
+                f.write(json.dumps(dict(zip(columns, row)), default=str) + "\n")
+
+
+def _write_excel(path, columns, chunks, sheet_name):
+    import xlsxwriter
+
+    # constant_memory flushes each row to disk as soon as it is written
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({
+            "bold": True,
+            "text_wrap": True,
+            "valign": "top",
+            "fg_color": "#D7E4BC",
+            "border": 1
+        })
+        worksheet.write_row(0, 0, columns, header_format)
+
+        # Track column widths while streaming instead of rescanning the data
+        widths = [len(str(c)) for c in columns]
+        row_num = 1
+        for _, rows in chunks:
+            for row in rows:
+                worksheet.write_row(row_num, 0, row)
+                for i, value in enumerate(row):
+                    if value is not None and widths[i] < MAX_COLUMN_WIDTH:
+                        widths[i] = max(widths[i], len(str(value)))
+                row_num += 1
+
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, min(width + 2, MAX_COLUMN_WIDTH))
+    finally:
+        workbook.close()
+
+
+# ==============================
+# EXPORT
+# ==============================
+
+def export_query(conn, query, fmt, params=(), sheet_name="Resume Data", chunk_size=1000):
+    """Stream a query result into a temp file and return its path
+
+    The caller owns the file; read it with open_export() to have it
+    removed afterwards.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    suffix, _ = EXPORT_FORMATS[fmt]
+    fd, path = tempfile.mkstemp(prefix="resume_export_", suffix=suffix)
+    os.close(fd)
+    try:
+        columns = _columns(conn, query, params)
+        chunks = iter_chunks(conn, query, params, chunk_size)
+        if fmt == "excel":
+            _write_excel(path, columns, chunks, sheet_name)
+        elif fmt == "csv":
+            _write_csv(path, columns, chunks)
+        else:
+            _write_ndjson(path, columns, chunks)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+@contextmanager
+def open_export(path):
+    """Open an exported file for reading and delete it when done"""
+    try:
+        with open(path, "rb") as f:
+            yield f
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
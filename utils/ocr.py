@@ -0,0 +1,122 @@
+"""
+OCR fallback for scanned PDF pages.
+
+Only pages whose text layer is missing or nearly empty are OCR'd. Each
+page is rendered with poppler's pdftoppm and read with tesseract (both
+installed by the Dockerfile). Pages run in parallel, with at most
+OCR_MAX_WORKERS OCR processes at a time. Results are cached by a hash
+of the page, so re-uploads and reruns skip the work.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import PyPDF2
+
+# Pages with fewer non-whitespace characters than this are OCR'd
+MIN_TEXT_CHARS = 25
+
+OCR_DPI = 300
+OCR_LANG = "eng"
+OCR_TIMEOUT = 60
+OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+OCR_CACHE_SIZE = 256
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_pool = None
+
+
+@lru_cache(maxsize=1)
+def ocr_available():
+    """True when the tesseract and pdftoppm binaries are on PATH"""
+    available = bool(shutil.which("tesseract") and shutil.which("pdftoppm"))
+    if not available:
+        logging.info("OCR disabled: tesseract or pdftoppm not found")
+    return available
+
+
+def needs_ocr(text):
+    """True when a page's text layer is too thin to be the real content"""
+    return len("".join((text or "").split())) < MIN_TEXT_CHARS
+
+
+def page_bytes(page):
+    """Serialize one PyPDF2 page as a standalone PDF"""
+    writer = PyPDF2.PdfWriter()
+    writer.add_page(page)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def ocr_pdf_page(data):
+    """OCR a single-page PDF given as bytes and return its text"""
+    with tempfile.TemporaryDirectory(prefix="ocr-") as tmp:
+        pdf_path = os.path.join(tmp, "page.pdf")
+        image_base = os.path.join(tmp, "page")
+        with open(pdf_path, "wb") as f:
+            f.write(data)
+
+        subprocess.run(
+            ["pdftoppm", "-r", str(OCR_DPI), "-gray", "-png", "-singlefile", pdf_path, image_base],
+            check=True, capture_output=True, timeout=OCR_TIMEOUT,
+        )
+        # One thread per tesseract process; parallelism comes from the pool
+        env = dict(os.environ, OMP_THREAD_LIMIT="1")
+        result = subprocess.run(
+            ["tesseract", image_base + ".png", "stdout", "-l", OCR_LANG],
+            check=True, capture_output=True, timeout=OCR_TIMEOUT, env=env,
+        )
+    return result.stdout.decode("utf-8", errors="ignore").strip()
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            # Workers only wait on the pdftoppm/tesseract processes, so
+            # threads are enough and Streamlit is never forked
+            _pool = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS, thread_name_prefix="ocr")
+        return _pool
+
+
+def _ocr_cached(key, data):
+    try:
+        text = ocr_pdf_page(data)
+    except Exception as e:
+        logging.warning("OCR failed for page %s: %s", key[:12], e)
+        return ""
+
+    with _lock:
+        _cache[key] = text
+        _cache.move_to_end(key)
+        while len(_cache) > OCR_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return text
+
+
+def submit_page(page):
+    """
+    Start OCR for one PyPDF2 page and return a Future with its text.
+    Cached pages come back as an already completed Future.
+    """
+    data = page_bytes(page)
+    key = hashlib.sha256(data).hexdigest()
+
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            future = Future()
+            future.set_result(_cache[key])
+            return future
+
+    return _get_pool().submit(_ocr_cached, key, data)
@@ -1,5 +1,12 @@
 import re
-from typing import Dict, List
+import numpy as np
+from typing import Dict, List, Optional, Set
+
+from .similarity import get_role_similarity
+from .skill_matcher import get_job_roles_matcher, get_role_index, get_skill_matcher
+
+# ATS score weights for the section, keyword, format and semantic scores
+ATS_WEIGHTS = (0.25, 0.35, 0.25, 0.15)
 
 
 class ResumeAnalyzer:
@@ -25,6 +32,9 @@ class ResumeAnalyzer:
             "projects": ["projects", "academic projects"]
         }
 
+        # One compiled matcher shared by every role in JOB_ROLES
+        self.skill_matcher = get_job_roles_matcher()
+
     # ===================================
     # DOCUMENT TYPE DETECTION
     # ===================================
@@ -84,12 +94,19 @@ class ResumeAnalyzer:
     # SKILL MATCH
     # ===================================
 
-    def keyword_match(self, text: str, required_skills: List[str]) -> Dict:
+    def find_skills(self, text: str, required_skills: List[str]) -> Set[str]:
+        """Normalized skills present in text, from a single scan."""
+        if self.skill_matcher.covers(required_skills):
+            return self.skill_matcher.find(text)
+        return get_skill_matcher(required_skills).find(text)
 
-        text = text.lower()
+    def keyword_match(self, text: str, required_skills: List[str],
+                      present: Optional[Set[str]] = None) -> Dict:
+
+        if present is None:
+            present = self.find_skills(text, required_skills)
 
-        found = [skill for skill in required_skills if skill.lower() in text]
-        missing = [skill for skill in required_skills if skill not in found]
+        found, missing = self.skill_matcher.split(required_skills, present)
 
         score = int((len(found) / len(required_skills)) * 100) if required_skills else 0
 
@@ -130,6 +147,10 @@ class ResumeAnalyzer:
 
         text = resume_data.get("raw_text", "")
 
+        # Accept page chunks straight from ResumeParser.iter_text
+        if not isinstance(text, str):
+            text = "\n".join(text).strip()
+
         doc_type = self.detect_document_type(text)
 
         if doc_type != "resume":
@@ -150,10 +171,26 @@ class ResumeAnalyzer:
 
         format_score, format_issues = self.formatting_score(text)
 
+        # Without a target role there is nothing to compare against
+        semantic_score = (
+            get_role_similarity().semantic_score(text, job_req) if job_req else None
+        )
+
+        return self._build_result(
+            personal, section_score, keyword, format_score, format_issues,
+            semantic_score
+        )
+
+    def _build_result(self, personal: Dict, section_score: int, keyword: Dict,
+                      format_score: int, format_issues: List[str],
+                      semantic_score: Optional[int]) -> Dict:
+
+        section_weight, keyword_weight, format_weight, semantic_weight = ATS_WEIGHTS
         ats_score = int(
-            section_score * 0.3 +
-            keyword["score"] * 0.4 +
-            format_score * 0.3
+            section_score * section_weight +
+            keyword["score"] * keyword_weight +
+            format_score * format_weight +
+            (semantic_score or 0) * semantic_weight
         )
 
         suggestions = format_issues.copy()
@@ -164,6 +201,9 @@ class ResumeAnalyzer:
         if section_score < 75:
             suggestions.append("Include all major sections")
 
+        if semantic_score is not None and semantic_score < 50:
+            suggestions.append("Describe your experience in terms closer to the role description")
+
         if not suggestions:
             suggestions.append("Excellent ATS-ready resume!")
 
@@ -174,5 +214,55 @@ class ResumeAnalyzer:
             "keyword_match": keyword,
             "section_score": section_score,
             "format_score": format_score,
+            "semantic_score": semantic_score,
             "suggestions": suggestions
-        }
\ No newline at end of file
+        }
+
+    # ===================================
+    # ROLE RANKING
+    # ===================================
+
+    def rank_roles(self, text, top_k: int = 5) -> List[Dict]:
+        """
+        Score one resume against every role in JOB_ROLES.
+        Role-independent checks run once; keyword and semantic
+        scores for all roles come from sparse matrix products.
+        """
+
+        if not isinstance(text, str):
+            text = "\n".join(text).strip()
+
+        if self.detect_document_type(text) != "resume":
+            return []
+
+        personal = self.extract_personal_info(text)
+        section_score = self.section_score(text)
+        format_score, format_issues = self.formatting_score(text)
+
+        index = get_role_index()
+        present = index.matcher.find(text)
+        keyword_scores = index.keyword_scores(present)
+        semantic_scores = get_role_similarity().semantic_scores(text)
+
+        section_weight, keyword_weight, format_weight, semantic_weight = ATS_WEIGHTS
+        ats_scores = (
+            section_score * section_weight +
+            keyword_scores * keyword_weight +
+            format_score * format_weight +
+            semantic_scores * semantic_weight
+        ).astype(int)
+
+        # Best ATS score first, keyword score breaks ties, catalog order after that
+        order = np.lexsort((np.arange(len(ats_scores)), -keyword_scores, -ats_scores))
+
+        ranked = []
+        for i in order[:top_k]:
+            category, role = index.roles[i]
+            keyword = self.keyword_match(text, index.required_skills[i], present)
+            result = self._build_result(
+                personal, section_score, keyword, format_score, format_issues,
+                int(semantic_scores[i])
+            )
+            ranked.append({"category": category, "role": role, **result})
+
+        return ranked
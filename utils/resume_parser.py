@@ -1,11 +1,19 @@
 import PyPDF2
 import docx
 import re
+from collections import deque
 from io import BytesIO
+from itertools import islice
+
+from .ocr import needs_ocr, ocr_available, submit_page
+from .skill_matcher import get_skill_matcher
 
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, ocr=True):
+        # OCR pages without a text layer (scanned resumes)
+        self.ocr = ocr
+
         # Expanded technical skills list
         self.skill_keywords = [
             "python", "java", "javascript", "html", "css", "sql",
@@ -15,22 +23,61 @@ class ResumeParser:
             "machine learning", "data science", "tensorflow",
             "pandas", "numpy", "power bi", "tableau"
         ]
+        self.skill_matcher = get_skill_matcher(self.skill_keywords)
 
     # ==============================
     # TEXT EXTRACTION
     # ==============================
 
-    def extract_text_from_pdf(self, pdf_file):
+    def iter_pdf_pages(self, pdf_file, max_pages=None):
+        """
+        Yield the text of each PDF page as it is extracted.
+        Reads straight from the uploaded buffer and stops
+        after max_pages when a limit is given.
+
+        Pages with little or no text layer are OCR'd in parallel;
+        pages are still yielded in document order.
+        """
         try:
-            reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
-            text = ""
-            for page in reader.pages:
-                if page.extract_text():
-                    text += page.extract_text() + "\n"
-            return text.strip()
+            pdf_file.seek(0)
+            reader = PyPDF2.PdfReader(pdf_file)
+            pages = reader.pages
+            if max_pages is not None:
+                pages = islice(pages, max_pages)
+
+            use_ocr = self.ocr and ocr_available()
+            # (OCR future or None, text layer) per page not yet yielded
+            pending = deque()
+            for page in pages:
+                page_text = page.extract_text()
+                if use_ocr and needs_ocr(page_text):
+                    pending.append((submit_page(page), page_text))
+                elif pending:
+                    pending.append((None, page_text))
+                elif page_text:
+                    yield page_text
+
+                while pending and (pending[0][0] is None or pending[0][0].done()):
+                    page_text = self._page_result(*pending.popleft())
+                    if page_text:
+                        yield page_text
+
+            while pending:
+                page_text = self._page_result(*pending.popleft())
+                if page_text:
+                    yield page_text
         except Exception as e:
             raise Exception(f"PDF Extraction Error: {str(e)}")
 
+    @staticmethod
+    def _page_result(future, page_text):
+        if future is None:
+            return page_text
+        return future.result() or page_text
+
+    def extract_text_from_pdf(self, pdf_file, max_pages=None):
+        return "\n".join(self.iter_pdf_pages(pdf_file, max_pages)).strip()
+
     def extract_text_from_docx(self, docx_file):
         try:
             document = docx.Document(BytesIO(docx_file.read()))
@@ -39,17 +86,24 @@ class ResumeParser:
         except Exception as e:
             raise Exception(f"DOCX Extraction Error: {str(e)}")
 
-    def extract_text(self, file):
+    def iter_text(self, file, max_pages=None):
+        """
+        Yield the document text chunk by chunk
+        (one chunk per page for PDFs).
+        """
         filename = file.name.lower()
         file.seek(0)
 
         if filename.endswith(".pdf"):
-            return self.extract_text_from_pdf(file)
+            yield from self.iter_pdf_pages(file, max_pages)
         elif filename.endswith(".docx"):
-            return self.extract_text_from_docx(file)
+            yield self.extract_text_from_docx(file)
         else:
             raise Exception("Unsupported file format. Only PDF and DOCX allowed.")
 
+    def extract_text(self, file, max_pages=None):
+        return "\n".join(self.iter_text(file, max_pages)).strip()
+
     # ==============================
     # SECTION EXTRACTION
     # ==============================
@@ -64,15 +118,8 @@ class ResumeParser:
     # ==============================
 
     def extract_skills(self, text):
-        text_lower = text.lower()
-        found_skills = []
-
-        for skill in self.skill_keywords:
-            pattern = rf"\b{re.escape(skill)}\b"
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-
-        return list(set(found_skills))
+        present = self.skill_matcher.find(text)
+        return [skill for skill in self.skill_keywords if skill in present]
 
     # ==============================
     # BASIC INFO EXTRACTION
@@ -90,8 +137,8 @@ class ResumeParser:
     # MAIN PARSER
     # ==============================
 
-    def parse(self, file):
-        text = self.extract_text(file)
+    def parse(self, file, max_pages=None):
+        text = self.extract_text(file, max_pages)
 
         skills = self.extract_skills(text)
         experience = self.extract_section(text, "experience")
@@ -108,4 +155,3 @@ class ResumeParser:
             "education": education,
             "raw_text": text
         }
-        
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+TF-IDF similarity between resumes and JOB_ROLES descriptions.
+
+The vectorizer is fitted once on one document per role (name,
+description, required and recommended skills). Scoring one or many
+resumes against every role is a single sparse matrix product.
+
+Usage:
+    python -m utils.similarity --rescore
+"""
+import argparse
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Cosine similarity that maps to a full 100 semantic score; role
+# documents are short, so good matches land around 0.3-0.5
+SIMILARITY_SATURATION = 0.5
+
+
+def role_document(job_req: Dict, role_name: str = "") -> str:
+    """Text that describes a role for the vectorizer"""
+    recommended = job_req.get("recommended_skills", {})
+    if isinstance(recommended, dict):
+        recommended = [skill for skills in recommended.values() for skill in skills]
+    return " ".join([
+        role_name,
+        job_req.get("description", ""),
+        " ".join(job_req.get("required_skills", [])),
+        " ".join(recommended or []),
+    ])
+
+
+def to_semantic_scores(similarities):
+    """Cosine similarities -> 0-100 integer scores"""
+    return (np.minimum(similarities / SIMILARITY_SATURATION, 1.0) * 100).astype(np.int64)
+
+
+class RoleSimilarityIndex:
+    """TF-IDF role matrix over a JOB_ROLES-shaped catalog"""
+
+    def __init__(self, job_roles: Dict):
+        self.roles = []
+        self._rows = {}
+        documents = []
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                self._rows[id(info)] = len(self.roles)
+                self.roles.append((category, role))
+                documents.append(role_document(info, role))
+
+        self.vectorizer = TfidfVectorizer(
+            sublinear_tf=True,
+            stop_words="english",
+            ngram_range=(1, 2),
+            # Keep tokens such as c++, c# and node.js whole
+            token_pattern=r"(?u)\b\w[\w+#.]*",
+        )
+        # Rows are L2-normalized, so a dot product is the cosine
+        self.role_matrix = self.vectorizer.fit_transform(documents)
+
+    def similarities(self, texts: Iterable[str]):
+        """(n_texts, n_roles) cosine similarities"""
+        vectors = self.vectorizer.transform(list(texts))
+        return (vectors @ self.role_matrix.T).toarray()
+
+    def semantic_scores(self, text: str):
+        """0-100 semantic score of one text against every role, in self.roles order"""
+        return to_semantic_scores(self.similarities([text])[0])
+
+    def semantic_score(self, text: str, job_req: Dict) -> int:
+        """0-100 semantic score of one text against one role"""
+        row = self._rows.get(id(job_req))
+        if row is not None:
+            # Same computation as semantic_scores(), so the two always agree
+            return int(self.semantic_scores(text)[row])
+
+        # A role that is not in the catalog is vectorized on the fly
+        role_vector = self.vectorizer.transform([role_document(job_req)])
+        similarity = (self.vectorizer.transform([text]) @ role_vector.T).toarray()[0, 0]
+        return int(to_semantic_scores(np.array([similarity]))[0])
+
+
+@lru_cache(maxsize=1)
+def get_role_similarity() -> RoleSimilarityIndex:
+    """Shared RoleSimilarityIndex over config.job_roles.JOB_ROLES."""
+    from config.job_roles import JOB_ROLES
+
+    return RoleSimilarityIndex(JOB_ROLES)
+
+
+# ==============================
+# STORED CORPUS
+# ==============================
+
+def rescore_stored_resumes(batch_size: int = 500) -> int:
+    """
+    Recompute semantic_score for every stored analysis.
+
+    Stored resumes keep no raw text, so their summary, experience,
+    projects, education and skills fields are scored against the
+    resume's target role. Resumes with all of those fields empty, or whose
+    target role is not in JOB_ROLES, keep a NULL semantic_score.
+    Historical ats_score values are left as they are: they cannot be
+    rebuilt faithfully without the raw text. Returns the number of
+    analyses updated.
+    """
+    from config.database import bump_data_version, get_database_connection
+
+    index = get_role_similarity()
+    role_rows = {role: i for i, (_, role) in enumerate(index.roles)}
+    conn = get_database_connection()
+    cursor = conn.cursor()
+
+    updated, last_id = 0, 0
+    try:
+        while True:
+            cursor.execute('''
+            SELECT r.id, r.target_role,
+                   COALESCE(r.summary, '') || ' ' || COALESCE(r.experience, '') || ' ' ||
+                   COALESCE(r.projects, '') || ' ' || COALESCE(r.education, '') || ' ' ||
+                   COALESCE(r.skills, '')
+            FROM resume_data r
+            WHERE r.id > ? AND EXISTS (SELECT 1 FROM resume_analysis a WHERE a.resume_id = r.id)
+            ORDER BY r.id
+            LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            scores = to_semantic_scores(index.similarities(row[2] for row in rows))
+            params = [
+                (int(scores[i, role_rows[role]]), resume_id)
+                for i, (resume_id, role, text) in enumerate(rows)
+                # Fields saved as "" or "[]" leave nothing to compare
+                if role in role_rows and re.search(r"\w", text)
+            ]
+            cursor.executemany('UPDATE resume_analysis SET semantic_score = ? WHERE resume_id = ?', params)
+            conn.commit()
+            updated += len(params)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if updated:
+        bump_data_version()
+    return updated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TF-IDF role similarity tools.")
+    parser.add_argument("--rescore", action="store_true",
+                        help="Recompute semantic scores for every stored analysis")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    if not args.rescore:
+        parser.print_help()
+        return 0
+
+    from config.database import init_database
+    init_database()
+    print(f"Rescored {rescore_stored_resumes(args.batch_size)} analyses", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
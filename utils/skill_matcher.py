@@ -0,0 +1,201 @@
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def normalize_skill(skill: str) -> str:
+    """Case-fold a skill name and collapse inner whitespace."""
+    return " ".join(skill.split()).casefold()
+
+
+class SkillMatcher:
+    """
+    Finds every skill of a fixed vocabulary in one pass over the text.
+
+    The vocabulary is compiled into a single trie-shaped regex, so the
+    cost of a scan barely grows with the number of skills. Matches are
+    case-insensitive, respect word boundaries (including skills such as
+    "C++" or "Node.js") and tolerate line breaks between words.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.vocabulary = frozenset(
+            key for key in (normalize_skill(s) for s in skills) if key
+        )
+        self._implied = self._build_implied(self.vocabulary)
+        self._pattern = self._compile(self.vocabulary)
+
+    # ===================================
+    # COMPILATION
+    # ===================================
+
+    @staticmethod
+    def _build_trie(terms) -> Dict:
+        root = {}
+        for term in terms:
+            node = root
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = True
+        return root
+
+    @classmethod
+    def _trie_regex(cls, node) -> str:
+        alternatives = []
+        for char in sorted(k for k in node if k):
+            piece = r"\s+" if char == " " else re.escape(char)
+            alternatives.append(piece + cls._trie_regex(node[char]))
+
+        if not alternatives:
+            return ""
+
+        body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        # Greedy optional: the longest skill wins, shorter ones on backtrack
+        return "(?:" + body + ")?" if "" in node else body
+
+    @classmethod
+    def _compile(cls, vocabulary):
+        if not vocabulary:
+            return None
+        trie = cls._trie_regex(cls._build_trie(vocabulary))
+        # Zero-width lookahead so overlapping skills at later offsets are seen
+        return re.compile(rf"(?<!\w)(?=({trie})(?!\w))")
+
+    @staticmethod
+    def _build_implied(vocabulary) -> Dict[str, Tuple[str, ...]]:
+        """Map each skill to shorter skills it starts with, e.g. "react native" -> "react"."""
+        implied = {}
+        for term in vocabulary:
+            prefixes = tuple(
+                other for other in vocabulary
+                if len(other) < len(term)
+                and term.startswith(other)
+                and not (term[len(other)].isalnum() or term[len(other)] == "_")
+            )
+            if prefixes:
+                implied[term] = prefixes
+        return implied
+
+    # ===================================
+    # MATCHING
+    # ===================================
+
+    def covers(self, skills: Iterable[str]) -> bool:
+        return all(normalize_skill(s) in self.vocabulary for s in skills)
+
+    def find(self, text: str) -> Set[str]:
+        """Return the normalized vocabulary skills present in text."""
+        if not text or self._pattern is None:
+            return set()
+
+        found = set()
+        for match in self._pattern.finditer(text.casefold()):
+            key = " ".join(match.group(1).split())
+            if key not in found:
+                found.add(key)
+                found.update(self._implied.get(key, ()))
+        return found
+
+    @staticmethod
+    def split(skills: Iterable[str], present: Set[str]) -> Tuple[List[str], List[str]]:
+        """Partition skills into (found, missing) given a find() result."""
+        found, missing = [], []
+        for skill in skills:
+            (found if normalize_skill(skill) in present else missing).append(skill)
+        return found, missing
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(vocabulary: Tuple[str, ...]) -> SkillMatcher:
+    return SkillMatcher(vocabulary)
+
+
+def get_skill_matcher(skills: Iterable[str]) -> SkillMatcher:
+    """Return a shared matcher for this vocabulary, compiling it only once."""
+    return _cached_matcher(tuple(sorted({normalize_skill(s) for s in skills})))
+
+
+def get_job_roles_matcher() -> SkillMatcher:
+    """Matcher over the required skills of every role in JOB_ROLES."""
+    from config.job_roles import JOB_ROLES
+
+    return get_skill_matcher(
+        skill
+        for roles in JOB_ROLES.values()
+        for role in roles.values()
+        for skill in role.get("required_skills", [])
+    )
+
+
+class RoleSkillIndex:
+    """
+    Role x skill incidence matrix over a JOB_ROLES-shaped catalog.
+
+    Scoring a resume against every role is a single sparse
+    matrix-vector product with the resume's skill vector.
+    """
+
+    def __init__(self, job_roles: Dict):
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        self.roles: List[Tuple[str, str]] = []
+        self.required_skills: List[List[str]] = []
+        skill_ids: Dict[str, int] = {}
+        rows, cols = [], []
+
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                skills = info.get("required_skills", [])
+                row = len(self.roles)
+                self.roles.append((category, role))
+                self.required_skills.append(skills)
+                for skill in skills:
+                    col = skill_ids.setdefault(normalize_skill(skill), len(skill_ids))
+                    rows.append(row)
+                    cols.append(col)
+
+        self.skill_ids = skill_ids
+        # Duplicate (role, skill) pairs are summed, matching list semantics
+        self.matrix = csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(self.roles), len(skill_ids)),
+        )
+        self.role_sizes = np.array([len(s) for s in self.required_skills], dtype=np.float64)
+        self.matcher = get_skill_matcher(skill_ids)
+        # Changes whenever any role is added, removed, reordered or edited;
+        # cached rankings are keyed on it
+        self.fingerprint = hashlib.sha256(
+            json.dumps(job_roles, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def skill_vector(self, present: Set[str]):
+        import numpy as np
+
+        vector = np.zeros(len(self.skill_ids))
+        ids = [self.skill_ids[s] for s in present if s in self.skill_ids]
+        vector[ids] = 1.0
+        return vector
+
+    def keyword_scores(self, present: Set[str]):
+        """Keyword match score (0-100) of every role, in self.roles order.
+
+        Uses the same arithmetic as ResumeAnalyzer.keyword_match so the
+        vectorized scores agree exactly with single-role scoring.
+        """
+        import numpy as np
+
+        found = self.matrix @ self.skill_vector(present)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(self.role_sizes > 0, (found / self.role_sizes) * 100, 0)
+        return scores.astype(np.int64)
+
+
+@lru_cache(maxsize=1)
+def get_role_index() -> RoleSkillIndex:
+    """Shared RoleSkillIndex over config.job_roles.JOB_ROLES."""
+    from config.job_roles import JOB_ROLES
+
+    return RoleSkillIndex(JOB_ROLES)